@@ -13,6 +13,70 @@ class LookupDecision:
     query: Optional[str] = None
 
 
+_PLATFORMS = (
+    "hulu", "netflix", "apple tv+", "disney+", "amazon prime",
+    "peacock", "paramount+", "hbo max", "on apple",
+)
+
+_EPISODE_PATTERNS = (
+    r"episodes?\s+per\s+season",
+    r"more\s+than\s+\d+\s+episodes?",
+    r"how\s+many\s+episodes?",
+    r"\d+\s+episodes?\s+per",
+)
+
+_DIRECTOR_PATTERNS = (
+    r"director\s+of",
+    r"by\s+the\s+director",
+    r"directed\s+by",
+    r"from\s+the\s+director",
+    r"creator\s+of",
+    r"created\s+by",
+)
+
+
+def _expand_decade(short: str) -> tuple[int, int]:
+    """Expand 2-digit decade to full years (e.g., '80' -> (1980, 1989))."""
+    decade = int(short)
+    if decade >= 20:  # 20-99 -> 1920-1999
+        century = 1900
+    else:  # 00-19 -> 2000-2019
+        century = 2000
+    start = century + decade
+    return (start, start + 9)
+
+
+# Every two-digit decade token expanded once at import; the matchers
+# return these shared tuples instead of rebuilding them per query.
+_SHORT_DECADES = {f"{n:02d}": _expand_decade(f"{n:02d}") for n in range(100)}
+
+
+def short_decade_range(match: re.Match) -> tuple[int, int]:
+    """Year range for a regex match whose first group is a 2-digit decade."""
+    short = match.group(1)
+    return _SHORT_DECADES.get(short) or _expand_decade(short)
+
+
+_TIME_PERIOD_PATTERNS = (
+    (r"(\d{4})s", lambda m: (int(m.group(1)), int(m.group(1)) + 9)),  # 1980s
+    (r"(\d{2})s\b", short_decade_range),  # 80s
+    (r"from\s+the\s+(\d{4})s", lambda m: (int(m.group(1)), int(m.group(1)) + 9)),
+    (r"from\s+the\s+(\d{2})s\b", short_decade_range),
+)
+
+_GENRE_KEYWORDS = {
+    "romance": ("romance", "romantic", "love story"),
+    "comedy": ("comedy", "funny", "comedic", "humor"),
+    "action": ("action", "thriller", "adventure"),
+    "horror": ("horror", "scary", "thriller"),
+    "drama": ("drama", "dramatic"),
+    "documentary": ("documentary", "doc", "docuseries"),
+    "animation": ("animated", "animation", "cartoon"),
+    "sci-fi": ("sci-fi", "science fiction", "scifi", "futuristic"),
+    "fantasy": ("fantasy", "magical"),
+}
+
+
 def needs_lookup(
     query: str,
     query_type: str,
@@ -47,9 +111,7 @@ def needs_lookup(
     # === ALWAYS LOOKUP patterns ===
 
     # Platform availability queries
-    platforms = ["hulu", "netflix", "apple tv+", "disney+", "amazon prime",
-                 "peacock", "paramount+", "hbo max", "on apple"]
-    for platform in platforms:
+    for platform in _PLATFORMS:
         if platform in query_lower:
             return LookupDecision(
                 should_lookup=True,
@@ -58,13 +120,7 @@ def needs_lookup(
             )
 
     # Episode count queries
-    episode_patterns = [
-        r"episodes?\s+per\s+season",
-        r"more\s+than\s+\d+\s+episodes?",
-        r"how\s+many\s+episodes?",
-        r"\d+\s+episodes?\s+per",
-    ]
-    for pattern in episode_patterns:
+    for pattern in _EPISODE_PATTERNS:
         if re.search(pattern, query_lower):
             return LookupDecision(
                 should_lookup=True,
@@ -73,15 +129,7 @@ def needs_lookup(
             )
 
     # Director/creator queries
-    director_patterns = [
-        r"director\s+of",
-        r"by\s+the\s+director",
-        r"directed\s+by",
-        r"from\s+the\s+director",
-        r"creator\s+of",
-        r"created\s+by",
-    ]
-    for pattern in director_patterns:
+    for pattern in _DIRECTOR_PATTERNS:
         if re.search(pattern, query_lower):
             return LookupDecision(
                 should_lookup=True,
@@ -101,14 +149,7 @@ def needs_lookup(
         )
 
     # Time period queries - check if SET in different era than RELEASED
-    time_period_patterns = [
-        (r"(\d{4})s", lambda m: (int(m.group(1)), int(m.group(1)) + 9)),  # 1980s
-        (r"(\d{2})s\b", lambda m: _expand_decade(m.group(1))),  # 80s
-        (r"from\s+the\s+(\d{4})s", lambda m: (int(m.group(1)), int(m.group(1)) + 9)),
-        (r"from\s+the\s+(\d{2})s\b", lambda m: _expand_decade(m.group(1))),
-    ]
-
-    for pattern, extractor in time_period_patterns:
+    for pattern, extractor in _TIME_PERIOD_PATTERNS:
         match = re.search(pattern, query_lower)
         if match:
             try:
@@ -126,20 +167,8 @@ def needs_lookup(
                 pass
 
     # Genre mismatch between query and metadata
-    genre_keywords = {
-        "romance": ["romance", "romantic", "love story"],
-        "comedy": ["comedy", "funny", "comedic", "humor"],
-        "action": ["action", "thriller", "adventure"],
-        "horror": ["horror", "scary", "thriller"],
-        "drama": ["drama", "dramatic"],
-        "documentary": ["documentary", "doc", "docuseries"],
-        "animation": ["animated", "animation", "cartoon"],
-        "sci-fi": ["sci-fi", "science fiction", "scifi", "futuristic"],
-        "fantasy": ["fantasy", "magical"],
-    }
-
     query_genre = None
-    for genre, keywords in genre_keywords.items():
+    for genre, keywords in _GENRE_KEYWORDS.items():
         for kw in keywords:
             if kw in query_lower:
                 query_genre = genre
@@ -150,7 +179,7 @@ def needs_lookup(
     if query_genre and result_genre:
         result_genre_lower = result_genre.lower()
         # Check if there's a potential mismatch
-        genre_matches = any(kw in result_genre_lower for kw in genre_keywords.get(query_genre, []))
+        genre_matches = any(kw in result_genre_lower for kw in _GENRE_KEYWORDS.get(query_genre, ()))
         if not genre_matches and query_genre != result_genre_lower:
             return LookupDecision(
                 should_lookup=True,
@@ -195,14 +224,3 @@ def needs_lookup(
         should_lookup=False,
         reason="Metadata sufficient for rating"
     )
-
-
-def _expand_decade(short: str) -> tuple[int, int]:
-    """Expand 2-digit decade to full years (e.g., '80' -> (1980, 1989))."""
-    decade = int(short)
-    if decade >= 20:  # 20-99 -> 1920-1999
-        century = 1900
-    else:  # 00-19 -> 2000-2019
-        century = 2000
-    start = century + decade
-    return (start, start + 9)
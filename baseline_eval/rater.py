@@ -2,7 +2,10 @@
 
 import re
 from dataclasses import dataclass
-from typing import Optional, List
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Mapping, Optional
+
+from .lookup import short_decade_range
 
 
 @dataclass
@@ -16,12 +19,26 @@ class RatingResult:
 
 VALID_RATINGS = ["Perfect", "Excellent", "Good", "Acceptable", "Off-Topic", "Problem"]
 
+# Keyword alternations scanned in a single regex pass instead of one
+# substring test per keyword.
+_ATV_PLUS_RE = re.compile(r"apple tv\+|atv\+|apple tv plus", re.IGNORECASE)
+_MAJOR_AWARD_RE = re.compile(
+    r"oscar|emmy|golden globe|academy award|bafta|won best", re.IGNORECASE
+)
+
 
 # =============================================================================
 # Helper Functions for Rating Modifiers
 # =============================================================================
 
 
+# IMDB popularity thresholds (ratings counts and chart rank).
+CLASSIC_RATING_COUNT = 100_000
+CLASSIC_PRE_2010_RATING_COUNT = 50_000
+ULTRA_POPULAR_RATING_COUNT = 500_000
+ULTRA_POPULAR_MAX_RANK = 250
+
+
 def is_classic_content(
     title: str,
     year: Optional[int],
@@ -36,11 +53,11 @@ def is_classic_content(
 
     Heuristic: >100K IMDB ratings OR year < 2010 with >50K ratings
     """
-    if imdb_rating_count and imdb_rating_count > 100000:
-        return True
-    if year and year < 2010 and imdb_rating_count and imdb_rating_count > 50000:
+    if not imdb_rating_count:
+        return False
+    if imdb_rating_count > CLASSIC_RATING_COUNT:
         return True
-    return False
+    return bool(year) and year < 2010 and imdb_rating_count > CLASSIC_PRE_2010_RATING_COUNT
 
 
 def is_atv_plus_content(result_source: Optional[str]) -> bool:
@@ -52,23 +69,24 @@ def is_atv_plus_content(result_source: Optional[str]) -> bool:
     If in doubt about 'Good' or 'Excellent' for ATV+ result, select 'Excellent'"
     """
     if result_source:
-        source_lower = result_source.lower()
-        return "apple tv+" in source_lower or "atv+" in source_lower or "apple tv plus" in source_lower
+        return _ATV_PLUS_RE.search(result_source) is not None
     return False
 
 
+@lru_cache(maxsize=4096)
 def has_major_awards(lookup_info: Optional[str]) -> bool:
     """
     Check if content won major awards (Oscar, Emmy, Golden Globe, BAFTA).
 
     Per image_12.png (Time Period matrix):
     Popular + Award = Excellent (not just ultra-popular)
+
+    Results are cached (bounded) because the same lookup text is often
+    checked for several results.
     """
     if not lookup_info:
         return False
-    awards = ["oscar", "emmy", "golden globe", "academy award", "bafta", "won best"]
-    lookup_lower = lookup_info.lower()
-    return any(award in lookup_lower for award in awards)
+    return _MAJOR_AWARD_RE.search(lookup_info) is not None
 
 
 def is_ultra_popular(
@@ -83,11 +101,16 @@ def is_ultra_popular(
 
     Proxy: IMDB top 250, or >500K ratings
     """
-    if imdb_rank and imdb_rank <= 250:
-        return True
-    if imdb_rating_count and imdb_rating_count > 500000:
+    if imdb_rank and imdb_rank <= ULTRA_POPULAR_MAX_RANK:
         return True
-    return False
+    return bool(imdb_rating_count) and imdb_rating_count > ULTRA_POPULAR_RATING_COUNT
+
+
+# Rating ladder from best to worst; _DEMOTE_NEXT maps each index to the
+# index one level down (Off-Topic is the floor).
+_RATING_ORDER = ("Perfect", "Excellent", "Good", "Acceptable", "Off-Topic")
+_RATING_INDEX = {rating: index for index, rating in enumerate(_RATING_ORDER)}
+_DEMOTE_NEXT = (1, 2, 3, 4, 4)
 
 
 def demote_rating(rating: str) -> str:
@@ -100,13 +123,81 @@ def demote_rating(rating: str) -> str:
     - Good → Acceptable
     - Acceptable → Off-Topic
     """
-    demotion = {
-        "Perfect": "Excellent",
-        "Excellent": "Good",
-        "Good": "Acceptable",
-        "Acceptable": "Off-Topic",
-    }
-    return demotion.get(rating, rating)
+    index = _RATING_INDEX.get(rating)
+    if index is None:
+        return rating
+    return _RATING_ORDER[_DEMOTE_NEXT[index]]
+
+
+# Standard Browse matrix indexed by is_popular | is_recent << 1.
+_STANDARD_BROWSE_MATRIX = ("Acceptable", "Good", "Good", "Excellent")
+
+
+def _standard_browse_rating(
+    is_popular: bool,
+    is_recent: bool,
+    lookup_info: Optional[str],
+    imdb_rating_count: Optional[int],
+    imdb_rank: Optional[int],
+) -> str:
+    """Standard Browse matrix: Popular + Recent = Excellent, either = Good."""
+    return _STANDARD_BROWSE_MATRIX[bool(is_popular) | bool(is_recent) << 1]
+
+
+def _time_period_browse_rating(
+    is_popular: bool,
+    is_recent: bool,
+    lookup_info: Optional[str],
+    imdb_rating_count: Optional[int],
+    imdb_rank: Optional[int],
+) -> str:
+    """Time period matrix (image_12.png): recency is irrelevant."""
+    # Ultra-popular = Excellent (regardless of awards)
+    if is_ultra_popular(imdb_rank, imdb_rating_count):
+        return "Excellent"
+    # Popular + Award = Excellent
+    if is_popular and has_major_awards(lookup_info):
+        return "Excellent"
+    # Popular (no award) = Good, not popular = Acceptable
+    return "Good" if is_popular else "Acceptable"
+
+
+def _rate_relevant_browse(
+    base_rating: Callable[..., str],
+    demote_kids: bool,
+    result_title: str,
+    result_year: Optional[str],
+    is_popular: bool,
+    is_recent: bool,
+    lookup_info: Optional[str],
+    result_source: Optional[str],
+    imdb_rating_count: Optional[int],
+    imdb_rank: Optional[int],
+) -> str:
+    """Rate a relevant Browse result with the query-level branches resolved."""
+    # Classic content waives recency (guideline 2.2.3.2). Classics need a
+    # ratings count, so skip parsing the year when there is none.
+    if imdb_rating_count and not is_recent:
+        year_int = None
+        if result_year:
+            try:
+                year_int = int(result_year[:4]) if len(result_year) >= 4 else int(result_year)
+            except (ValueError, TypeError):
+                pass
+        if is_classic_content(result_title, year_int, imdb_rating_count):
+            is_recent = True  # Waived for classics
+
+    rating = base_rating(is_popular, is_recent, lookup_info, imdb_rating_count, imdb_rank)
+
+    # ATV+ benefit of doubt: Good → Excellent (guideline 2.2.2.1)
+    if rating == "Good" and is_atv_plus_content(result_source):
+        rating = "Excellent"
+
+    # Kids content demotion (but never below Acceptable)
+    if demote_kids and rating != "Acceptable":
+        rating = demote_rating(rating)
+
+    return rating
 
 
 def rate_browse(
@@ -145,54 +236,130 @@ def rate_browse(
     if not is_relevant:
         return "Off-Topic"
 
-    # Parse year for classic detection
-    year_int = None
-    if result_year:
-        try:
-            year_int = int(result_year[:4]) if len(result_year) >= 4 else int(result_year)
-        except (ValueError, TypeError):
-            pass
-
-    # Classic content waives recency (guideline 2.2.3.2)
-    if is_classic_content(result_title, year_int, imdb_rating_count):
-        is_recent = True  # Waived for classics
-
-    # Time period queries have special logic (image_12.png)
-    if is_time_period_query:
-        # Ultra-popular = Excellent (regardless of awards)
-        if is_ultra_popular(imdb_rank, imdb_rating_count):
-            rating = "Excellent"
-        # Popular + Award = Excellent
-        elif is_popular and has_major_awards(lookup_info):
-            rating = "Excellent"
-        # Popular (no award) = Good
-        elif is_popular:
-            rating = "Good"
-        # Not popular = Acceptable
-        else:
-            rating = "Acceptable"
-    else:
-        # Standard Browse logic
-        if is_popular and is_recent:
-            rating = "Excellent"
-        elif is_popular or is_recent:
-            rating = "Good"
-        else:
-            rating = "Acceptable"
+    return _rate_relevant_browse(
+        _time_period_browse_rating if is_time_period_query else _standard_browse_rating,
+        is_kids_content and not is_kids_query,
+        result_title,
+        result_year,
+        is_popular,
+        is_recent,
+        lookup_info,
+        result_source,
+        imdb_rating_count,
+        imdb_rank,
+    )
+
+
+@lru_cache(maxsize=None)
+def compile_browse_rater(
+    is_time_period_query: bool = False,
+    is_kids_query: bool = False,
+) -> Callable[..., str]:
+    """
+    Specialize rate_browse for one query's flags.
 
-    # ATV+ benefit of doubt: Good → Excellent (guideline 2.2.2.1)
-    if rating == "Good" and is_atv_plus_content(result_source):
-        rating = "Excellent"
+    The time-period and kids-query branches are fixed for every result of
+    a query, so they are resolved once here. The returned function takes
+    the per-result keyword arguments of rate_browse and gives the same
+    rating; extra rate_browse arguments (query, result_type, ...) are
+    accepted and ignored.
+    """
+    base_rating = _time_period_browse_rating if is_time_period_query else _standard_browse_rating
+
+    def rate(
+        result_title: str,
+        result_year: Optional[str],
+        is_relevant: bool,
+        is_popular: bool,
+        is_recent: bool,
+        is_kids_content: bool = False,
+        lookup_info: Optional[str] = None,
+        result_source: Optional[str] = None,
+        imdb_rating_count: Optional[int] = None,
+        imdb_rank: Optional[int] = None,
+        **_unused: Any,
+    ) -> str:
+        if not is_relevant:
+            return "Off-Topic"
+        return _rate_relevant_browse(
+            base_rating,
+            is_kids_content and not is_kids_query,
+            result_title,
+            result_year,
+            is_popular,
+            is_recent,
+            lookup_info,
+            result_source,
+            imdb_rating_count,
+            imdb_rank,
+        )
+
+    return rate
+
+
+def _build_browse_flag_table() -> tuple:
+    table = []
+    for flags in range(64):
+        table.append(rate_browse(
+            query="",
+            result_title="",
+            result_type="",
+            result_genre=None,
+            result_year=None,
+            is_relevant=bool(flags & 0b100000),
+            is_popular=bool(flags & 0b010000),
+            is_recent=bool(flags & 0b001000),
+            is_time_period_query=bool(flags & 0b000100),
+            is_kids_content=bool(flags & 0b000010),
+            is_kids_query=bool(flags & 0b000001),
+        ))
+    return tuple(table)
+
+
+# rate_browse for every combination of its six boolean inputs, with no
+# IMDB counts, lookup info or source. See rate_browse_index.
+_BROWSE_FLAG_TABLE = _build_browse_flag_table()
+
+
+def rate_browse_index(flags: int) -> str:
+    """
+    Rate a Browse result from packed boolean flags with one table lookup.
 
-    # Kids content demotion (but never below Acceptable)
-    if is_kids_content and not is_kids_query and rating != "Acceptable":
-        kids_demotion = {
-            "Excellent": "Good",
-            "Good": "Acceptable",
-        }
-        rating = kids_demotion.get(rating, rating)
+    flags = (is_relevant << 5) | (is_popular << 4) | (is_recent << 3)
+            | (is_time_period_query << 2) | (is_kids_content << 1) | is_kids_query
+
+    Equivalent to rate_browse only when imdb_rating_count, imdb_rank,
+    lookup_info and result_source are all absent; use rate_browse when
+    any of those modifiers can apply.
+    """
+    if not 0 <= flags < len(_BROWSE_FLAG_TABLE):
+        raise ValueError(f"flags must be in range(64), got {flags!r}")
+    return _BROWSE_FLAG_TABLE[flags]
 
-    return rating
+
+def rate_browse_batch(
+    rows: Iterable[Mapping[str, Any]],
+    **shared: Any,
+) -> List[str]:
+    """
+    Rate a batch of Browse results.
+
+    Each row holds the per-result keyword arguments of rate_browse.
+    Per-query arguments (query, is_time_period_query, is_kids_query)
+    are passed once via ``shared``; the query flags select one
+    compile_browse_rater specialization that rates every row, so
+    query flags inside a row are ignored.
+    """
+    rate = compile_browse_rater(
+        bool(shared.pop("is_time_period_query", False)),
+        bool(shared.pop("is_kids_query", False)),
+    )
+    return [rate(**row) for row in rows]
+
+
+# _RATING_ORDER index per similarity score (2*target + factual + theme):
+# Off-Topic, Acceptable, Good, Good, Excellent.
+_SIMILARITY_LEVELS = (4, 3, 2, 2, 1)
 
 
 def rate_similarity(
@@ -228,26 +395,12 @@ def rate_similarity(
 
     When on_navigational_query=True, demote by 1 level (image_10.png).
     """
-    matches = sum([target_audience_match, factual_match, theme_match])
-
-    if matches == 3:
-        rating = "Excellent"
-    elif matches == 2:
-        rating = "Good"
-    elif matches == 1:
-        # Bug 1 fix: Target Audience alone = Good (per image_06.png row 5)
-        if target_audience_match:
-            rating = "Good"
-        else:
-            rating = "Acceptable"
-    else:
-        rating = "Off-Topic"
-
-    # Bug 6 fix: Similarity on Navigational = demote by 1 (per image_10.png)
-    if on_navigational_query:
-        rating = demote_rating(rating)
-
-    return rating
+    # Target audience weighs 2 so that it alone reaches Good (Bug 1 fix,
+    # image_06.png row 5); Bug 6 fix demotes by 1 on Navigational queries
+    # (image_10.png), flooring at Off-Topic.
+    score = 2 * bool(target_audience_match) + bool(factual_match) + bool(theme_match)
+    level = _SIMILARITY_LEVELS[score] + bool(on_navigational_query)
+    return _RATING_ORDER[min(level, len(_RATING_ORDER) - 1)]
 
 
 def rate_navigational(
@@ -307,21 +460,24 @@ def rate_navigational(
     return "Good"
 
 
+# Checked in order; the first pattern that matches wins.
+_TIME_PERIOD_PATTERNS = (
+    (re.compile(r"(\d{4})s\b"), lambda m: (int(m.group(1)), int(m.group(1)) + 9)),
+    (re.compile(r"\b(\d{2})s\b"), short_decade_range),
+    (re.compile(r"from\s+the\s+(\d{4})s"), lambda m: (int(m.group(1)), int(m.group(1)) + 9)),
+    (re.compile(r"from\s+the\s+(\d{2})s\b"), short_decade_range),
+)
+
+
 def detect_time_period_query(query: str) -> tuple[bool, Optional[tuple[int, int]]]:
     """
     Detect if query is asking for specific time period content.
 
     Returns (is_time_period_query, (decade_start, decade_end) or None).
     """
-    patterns = [
-        (r"(\d{4})s\b", lambda m: (int(m.group(1)), int(m.group(1)) + 9)),
-        (r"\b(\d{2})s\b", lambda m: _expand_decade(m.group(1))),
-        (r"from\s+the\s+(\d{4})s", lambda m: (int(m.group(1)), int(m.group(1)) + 9)),
-        (r"from\s+the\s+(\d{2})s\b", lambda m: _expand_decade(m.group(1))),
-    ]
-
-    for pattern, extractor in patterns:
-        match = re.search(pattern, query.lower())
+    query_lower = query.lower()
+    for pattern, extractor in _TIME_PERIOD_PATTERNS:
+        match = pattern.search(query_lower)
         if match:
             try:
                 return (True, extractor(match))
@@ -331,54 +487,73 @@ def detect_time_period_query(query: str) -> tuple[bool, Optional[tuple[int, int]
     return (False, None)
 
 
+_ACTOR_RE = re.compile("|".join((
+    r"starring\s+",
+    r"movies?\s+with\s+",
+    r"shows?\s+with\s+",
+    r"films?\s+with\s+",
+    r"everything\s+with\s+",
+    r"featuring\s+",
+)))
+
+
 def detect_actor_query(query: str) -> bool:
     """Detect if query is looking for actor's filmography."""
-    actor_patterns = [
-        r"starring\s+",
-        r"movies?\s+with\s+",
-        r"shows?\s+with\s+",
-        r"films?\s+with\s+",
-        r"everything\s+with\s+",
-        r"featuring\s+",
-    ]
-    for pattern in actor_patterns:
-        if re.search(pattern, query.lower()):
-            return True
-    return False
+    return _ACTOR_RE.search(query.lower()) is not None
+
+
+_AGE_RE = re.compile(r"(\d+)\+?")
+_KIDS_RATINGS = frozenset({"G", "PG", "TV-Y", "TV-Y7", "TV-G"})
 
 
 def detect_kids_content(recommended_age: Optional[str], rating: Optional[str]) -> bool:
     """Detect if content is kids-oriented."""
     if recommended_age:
         # Parse age like "7+", "8+", "10+"
-        match = re.match(r"(\d+)\+?", recommended_age)
+        match = _AGE_RE.match(recommended_age)
         if match:
             age = int(match.group(1))
             if age <= 10:
                 return True
 
     if rating:
-        kids_ratings = ["G", "PG", "TV-Y", "TV-Y7", "TV-G"]
-        if rating.upper() in kids_ratings:
+        if rating.upper() in _KIDS_RATINGS:
             return True
 
     return False
 
 
+_KIDS_QUERY_RE = re.compile("|".join((
+    r"\bkids?\b",
+    r"\bchildren\b",
+    r"\bfamily\b",
+    r"\bfor\s+my\s+kids?\b",
+    r"\banimated\b",
+    r"\bcartoon\b",
+)))
+
+
 def detect_kids_query(query: str) -> bool:
     """Detect if query is specifically for kids content."""
-    kids_patterns = [
-        r"\bkids?\b",
-        r"\bchildren\b",
-        r"\bfamily\b",
-        r"\bfor\s+my\s+kids?\b",
-        r"\banimated\b",
-        r"\bcartoon\b",
-    ]
-    for pattern in kids_patterns:
-        if re.search(pattern, query.lower()):
-            return True
-    return False
+    return _KIDS_QUERY_RE.search(query.lower()) is not None
+
+
+# Result connection clause indexed by is_popular | is_recent << 1.
+_CONNECTION_CLAUSES = (
+    " that, while relevant, is neither particularly popular nor recent",
+    " that is popular but not recent",
+    " that is recent but less well-known",
+    " that is both popular and recent",
+)
+
+_RATING_JUSTIFICATIONS = {
+    "Perfect": "This is the primary intent of the query, making it a perfect result.",
+    "Excellent": "This makes it an excellent result for the query.",
+    "Good": "This makes it a good result for the query.",
+    "Acceptable": "While relevant, the result is acceptable but not ideal.",
+    "Off-Topic": "This result is off-topic as it does not match the query intent.",
+    "Problem": "There is a technical issue with this result.",
+}
 
 
 def generate_reasoning(
@@ -417,19 +592,10 @@ def generate_reasoning(
 
     # 3. Result connection
     if is_relevant:
-        connection = f"{result_title} is a {result_type.lower()}"
-        if is_popular and is_recent:
-            connection += " that is both popular and recent"
-        elif is_popular:
-            connection += " that is popular but not recent"
-        elif is_recent:
-            connection += " that is recent but less well-known"
-        else:
-            connection += " that, while relevant, is neither particularly popular nor recent"
-
+        clause = _CONNECTION_CLAUSES[bool(is_popular) | bool(is_recent) << 1]
+        connection = f"{result_title} is a {result_type.lower()}{clause}"
         if lookup_info:
-            connection += f". {lookup_info}"
-
+            connection = f"{connection}. {lookup_info}"
         parts.append(connection + ".")
     else:
         parts.append(f"{result_title} is not relevant to this query as it does not match the search intent.")
@@ -443,6 +609,9 @@ def generate_reasoning(
     return " ".join(parts)
 
 
+_SIMILAR_REF_RE = re.compile(r"(?:like|similar to)\s+(.+?)(?:\s*$|\s+and|\s+or)")
+
+
 def _expand_intent(query: str, query_type: str) -> str:
     """Expand query into intent description."""
     query_lower = query.lower()
@@ -451,7 +620,7 @@ def _expand_intent(query: str, query_type: str) -> str:
         return f"a specific piece of content matching '{query}'"
     elif query_type == "Similarity":
         # Extract the reference
-        match = re.search(r"(?:like|similar to)\s+(.+?)(?:\s*$|\s+and|\s+or)", query_lower)
+        match = _SIMILAR_REF_RE.search(query_lower)
         if match:
             ref = match.group(1)
             return f"content similar to {ref}"
@@ -460,19 +629,27 @@ def _expand_intent(query: str, query_type: str) -> str:
         return f"content matching the browsing intent: {query}"
 
 
+def _expand_short_decade(match: re.Match) -> str:
+    start, end = short_decade_range(match)
+    return f"The {match.group(1)}s refers to the years {start} to {end}."
+
+
+# Checked in order; the first pattern that matches wins.
+_ABBREVIATIONS = [
+    (re.compile(r"\b(\d{2})s\b"), _expand_short_decade),
+    (re.compile(r"\b(\d{4})s\b"), lambda m: f"The {m.group(1)}s refers to the years {int(m.group(1))} to {int(m.group(1)) + 9}."),
+    (re.compile(r"\brom-?com\b"), lambda _: "Rom-com is an abbreviation for romantic comedy."),
+    (re.compile(r"\bsci-?fi\b"), lambda _: "Sci-fi is an abbreviation for science fiction."),
+    (re.compile(r"\batv\+?\b"), lambda _: "ATV+ refers to Apple TV+ streaming service."),
+    (re.compile(r"\bdoc\b"), lambda _: "Doc is short for documentary."),
+]
+
+
 def _detect_abbreviation(query: str) -> Optional[str]:
     """Detect and expand common abbreviations in query."""
-    abbrevs = {
-        r"\b(\d{2})s\b": lambda m: f"The {m.group(1)}s refers to the years {_expand_decade(m.group(1))[0]} to {_expand_decade(m.group(1))[1]}.",
-        r"\b(\d{4})s\b": lambda m: f"The {m.group(1)}s refers to the years {int(m.group(1))} to {int(m.group(1)) + 9}.",
-        r"\brom-?com\b": lambda _: "Rom-com is an abbreviation for romantic comedy.",
-        r"\bsci-?fi\b": lambda _: "Sci-fi is an abbreviation for science fiction.",
-        r"\batv\+?\b": lambda _: "ATV+ refers to Apple TV+ streaming service.",
-        r"\bdoc\b": lambda _: "Doc is short for documentary.",
-    }
-
-    for pattern, expander in abbrevs.items():
-        match = re.search(pattern, query.lower())
+    query_lower = query.lower()
+    for pattern, expander in _ABBREVIATIONS:
+        match = pattern.search(query_lower)
         if match:
             return expander(match)
 
@@ -487,23 +664,4 @@ def _rating_justification(
     is_recent: bool,
 ) -> str:
     """Generate rating justification."""
-    justifications = {
-        "Perfect": "This is the primary intent of the query, making it a perfect result.",
-        "Excellent": "This makes it an excellent result for the query.",
-        "Good": "This makes it a good result for the query.",
-        "Acceptable": "While relevant, the result is acceptable but not ideal.",
-        "Off-Topic": "This result is off-topic as it does not match the query intent.",
-        "Problem": "There is a technical issue with this result.",
-    }
-    return justifications.get(rating, "")
-
-
-def _expand_decade(short: str) -> tuple[int, int]:
-    """Expand 2-digit decade to full years."""
-    decade = int(short)
-    if decade >= 20:
-        century = 1900
-    else:
-        century = 2000
-    start = century + decade
-    return (start, start + 9)
+    return _RATING_JUSTIFICATIONS.get(rating, "")
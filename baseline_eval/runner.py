@@ -460,8 +460,9 @@ class BaselineRunner:
             r"movies\s+like\s+(.+)",
             r"shows\s+like\s+(.+)",
         ]
+        query_lower = query.lower()
         for pattern in patterns:
-            match = re.search(pattern, query.lower())
+            match = re.search(pattern, query_lower)
             if match:
                 return match.group(1).strip()
         return "referenced content"
@@ -0,0 +1,41 @@
+import pytest
+
+from baseline_eval.lookup import needs_lookup
+from baseline_eval.rater import (
+    compile_browse_rater,
+    generate_reasoning,
+    is_classic_content,
+    is_ultra_popular,
+    rate_browse,
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _warmup():
+    """Prime regex and specialization caches before a module's first test."""
+    is_ultra_popular(1, 1)
+    is_classic_content("", 2000, 1)
+    needs_lookup(query="x", query_type="Browse", result_title="x", result_type="Movie")
+    rate_browse(
+        query="x",
+        result_title="x",
+        result_type="Movie",
+        result_genre=None,
+        result_year="2000",
+        is_relevant=True,
+        is_popular=True,
+        is_recent=True,
+    )
+    for is_time_period_query in (False, True):
+        for is_kids_query in (False, True):
+            compile_browse_rater(is_time_period_query, is_kids_query)
+    generate_reasoning(
+        query="x",
+        query_type="Browse",
+        result_title="x",
+        result_type="Movie",
+        rating="Good",
+        is_relevant=True,
+        is_popular=True,
+        is_recent=True,
+    )
@@ -3,6 +3,9 @@
 import pytest
 from baseline_eval.rater import (
     rate_browse,
+    rate_browse_batch,
+    rate_browse_index,
+    compile_browse_rater,
     rate_similarity,
     rate_navigational,
     detect_time_period_query,
@@ -22,295 +25,263 @@ from baseline_eval.rater import (
 class TestBrowseRating:
     """Test Browse query rating logic."""
 
-    def test_relevant_popular_recent_excellent(self):
-        """Relevant + Popular + Recent = Excellent."""
-        rating = rate_browse(
-            query="action movies",
-            result_title="Top Gun: Maverick",
-            result_type="Movie",
-            result_genre="Action",
-            result_year="2022",
-            is_relevant=True,
-            is_popular=True,
-            is_recent=True,
-        )
-        assert rating == "Excellent"
-
-    def test_relevant_popular_not_recent_good(self):
-        """Relevant + Popular + Not Recent = Good."""
-        rating = rate_browse(
-            query="action movies",
-            result_title="Top Gun",
-            result_type="Movie",
-            result_genre="Action",
-            result_year="1986",
-            is_relevant=True,
-            is_popular=True,
-            is_recent=False,
-        )
-        assert rating == "Good"
-
-    def test_relevant_not_popular_recent_good(self):
-        """Relevant + Not Popular + Recent = Good."""
-        rating = rate_browse(
-            query="action movies",
-            result_title="Unknown Action",
-            result_type="Movie",
-            result_genre="Action",
-            result_year="2023",
-            is_relevant=True,
-            is_popular=False,
-            is_recent=True,
-        )
-        assert rating == "Good"
-
-    def test_relevant_not_popular_not_recent_acceptable(self):
-        """Relevant + Not Popular + Not Recent = Acceptable."""
-        rating = rate_browse(
-            query="action movies",
-            result_title="Old Unknown",
-            result_type="Movie",
-            result_genre="Action",
-            result_year="1995",
-            is_relevant=True,
-            is_popular=False,
-            is_recent=False,
-        )
-        assert rating == "Acceptable"
-
-    def test_not_relevant_off_topic(self):
-        """Not Relevant = Off-Topic."""
-        rating = rate_browse(
-            query="action movies",
-            result_title="The Notebook",
-            result_type="Movie",
-            result_genre="Romance",
-            result_year="2004",
-            is_relevant=False,
-            is_popular=True,
-            is_recent=False,
-        )
-        assert rating == "Off-Topic"
-
-    def test_time_period_popular_no_award_good(self):
-        """Time period queries: Popular (no award) = Good per image_12.png."""
-        rating = rate_browse(
-            query="best 80s movies",
-            result_title="Top Gun",
-            result_type="Movie",
-            result_genre="Action",
-            result_year="1986",
-            is_relevant=True,
-            is_popular=True,
-            is_recent=False,  # Recency irrelevant for time period
-            is_time_period_query=True,
-        )
-        # Per image_12.png: Popular + No Award = Good (not Excellent)
-        assert rating == "Good"
-
-    def test_time_period_ultra_popular_excellent(self):
-        """Time period queries: Ultra-popular = Excellent regardless of awards."""
-        rating = rate_browse(
-            query="best 80s movies",
-            result_title="Top Gun",
-            result_type="Movie",
-            result_genre="Action",
-            result_year="1986",
-            is_relevant=True,
-            is_popular=True,
-            is_recent=False,
-            is_time_period_query=True,
-            imdb_rating_count=600000,  # Ultra-popular: >500K
-        )
-        assert rating == "Excellent"
-
-    def test_kids_content_demotion(self):
-        """Kids content should be demoted by 1 level."""
-        rating = rate_browse(
-            query="comedy movies",
-            result_title="Secret Life of Pets",
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                # Relevant + Popular + Recent = Excellent.
+                dict(query="action movies", result_title="Top Gun: Maverick", result_genre="Action",
+                     result_year="2022", is_relevant=True, is_popular=True, is_recent=True),
+                "Excellent",
+                id="relevant_popular_recent_excellent",
+            ),
+            pytest.param(
+                # Relevant + Popular + Not Recent = Good.
+                dict(query="action movies", result_title="Top Gun", result_genre="Action",
+                     result_year="1986", is_relevant=True, is_popular=True, is_recent=False),
+                "Good",
+                id="relevant_popular_not_recent_good",
+            ),
+            pytest.param(
+                # Relevant + Not Popular + Recent = Good.
+                dict(query="action movies", result_title="Unknown Action", result_genre="Action",
+                     result_year="2023", is_relevant=True, is_popular=False, is_recent=True),
+                "Good",
+                id="relevant_not_popular_recent_good",
+            ),
+            pytest.param(
+                # Relevant + Not Popular + Not Recent = Acceptable.
+                dict(query="action movies", result_title="Old Unknown", result_genre="Action",
+                     result_year="1995", is_relevant=True, is_popular=False, is_recent=False),
+                "Acceptable",
+                id="relevant_not_popular_not_recent_acceptable",
+            ),
+            pytest.param(
+                # Not Relevant = Off-Topic.
+                dict(query="action movies", result_title="The Notebook", result_genre="Romance",
+                     result_year="2004", is_relevant=False, is_popular=True, is_recent=False),
+                "Off-Topic",
+                id="not_relevant_off_topic",
+            ),
+            pytest.param(
+                # Time period queries: Popular (no award) = Good per image_12.png
+                # (not Excellent). Recency irrelevant for time period.
+                dict(query="best 80s movies", result_title="Top Gun", result_genre="Action",
+                     result_year="1986", is_relevant=True, is_popular=True, is_recent=False,
+                     is_time_period_query=True),
+                "Good",
+                id="time_period_popular_no_award_good",
+            ),
+            pytest.param(
+                # Time period queries: Ultra-popular (>500K) = Excellent regardless of awards.
+                dict(query="best 80s movies", result_title="Top Gun", result_genre="Action",
+                     result_year="1986", is_relevant=True, is_popular=True, is_recent=False,
+                     is_time_period_query=True, imdb_rating_count=600000),
+                "Excellent",
+                id="time_period_ultra_popular_excellent",
+            ),
+            pytest.param(
+                # Kids content should be demoted by 1 level (from Excellent).
+                dict(query="comedy movies", result_title="Secret Life of Pets", result_genre="Animation",
+                     result_year="2016", is_relevant=True, is_popular=True, is_recent=True,
+                     is_kids_content=True, is_kids_query=False),
+                "Good",
+                id="kids_content_demotion",
+            ),
+            pytest.param(
+                # Kids content should NOT be demoted for kids queries.
+                dict(query="kids animated movies", result_title="Secret Life of Pets", result_genre="Animation",
+                     result_year="2016", is_relevant=True, is_popular=True, is_recent=True,
+                     is_kids_content=True, is_kids_query=True),
+                "Excellent",
+                id="kids_content_no_demotion_for_kids_query",
+            ),
+        ],
+    )
+    def test_browse(self, kwargs, expected):
+        """Browse rating matrix and modifiers."""
+        assert rate_browse(result_type="Movie", **kwargs) == expected
+
+
+class TestBrowseBatchRating:
+    """Test batch Browse rating."""
+
+    def test_batch_matches_scalar(self):
+        """Batch rating returns the same ratings as rate_browse per row."""
+        rows = [
+            dict(result_title="Top Gun: Maverick", result_type="Movie", result_genre="Action",
+                 result_year="2022", is_relevant=True, is_popular=True, is_recent=True),
+            dict(result_title="Top Gun", result_type="Movie", result_genre="Action",
+                 result_year="1986", is_relevant=True, is_popular=True, is_recent=False),
+            dict(result_title="The Notebook", result_type="Movie", result_genre="Romance",
+                 result_year="2004", is_relevant=False, is_popular=True, is_recent=False),
+        ]
+        ratings = rate_browse_batch(rows, query="action movies")
+        assert ratings == [rate_browse(query="action movies", **row) for row in rows]
+        assert ratings == ["Excellent", "Good", "Off-Topic"]
+
+    def test_batch_applies_shared_query_flags(self):
+        """Shared query flags reach every row of the batch."""
+        rows = [
+            dict(result_title="Heat", result_type="Movie", result_genre="Crime",
+                 result_year="1995", is_relevant=True, is_popular=True, is_recent=False),
+            dict(result_title="Toy Story 4", result_type="Movie", result_genre="Animation",
+                 result_year="2019", is_relevant=True, is_popular=True, is_recent=True,
+                 is_kids_content=True),
+        ]
+        shared = dict(query="kids movies", is_kids_query=True)
+        ratings = rate_browse_batch(rows, **shared)
+        assert ratings == [rate_browse(**shared, **row) for row in rows]
+        assert ratings == ["Good", "Excellent"]
+
+    @pytest.mark.parametrize("is_time_period_query", [False, True])
+    @pytest.mark.parametrize("is_kids_query", [False, True])
+    def test_compiled_rater_matches_scalar(self, is_time_period_query, is_kids_query):
+        """A rater specialized on query flags agrees with rate_browse."""
+        rate = compile_browse_rater(is_time_period_query, is_kids_query)
+        row = dict(result_title="Secret Life of Pets", result_type="Movie", result_genre="Animation",
+                   result_year="2016", is_relevant=True, is_popular=True, is_recent=True,
+                   is_kids_content=True, imdb_rating_count=600000)
+        expected = rate_browse(
+            query="best 2010s movies",
+            is_time_period_query=is_time_period_query,
+            is_kids_query=is_kids_query,
+            **row,
+        )
+        assert rate(query="best 2010s movies", **row) == expected
+
+    @pytest.mark.parametrize("flags", range(64))
+    def test_flag_table_matches_scalar(self, flags):
+        """Packed-flag table lookup agrees with rate_browse for all 64 inputs."""
+        expected = rate_browse(
+            query="movies",
+            result_title="Some Title",
             result_type="Movie",
-            result_genre="Animation",
+            result_genre=None,
             result_year="2016",
-            is_relevant=True,
-            is_popular=True,
-            is_recent=True,
-            is_kids_content=True,
-            is_kids_query=False,
+            is_relevant=bool(flags & 32),
+            is_popular=bool(flags & 16),
+            is_recent=bool(flags & 8),
+            is_time_period_query=bool(flags & 4),
+            is_kids_content=bool(flags & 2),
+            is_kids_query=bool(flags & 1),
         )
-        assert rating == "Good"  # Demoted from Excellent
+        assert rate_browse_index(flags) == expected
 
-    def test_kids_content_no_demotion_for_kids_query(self):
-        """Kids content should NOT be demoted for kids queries."""
-        rating = rate_browse(
-            query="kids animated movies",
-            result_title="Secret Life of Pets",
-            result_type="Movie",
-            result_genre="Animation",
-            result_year="2016",
-            is_relevant=True,
-            is_popular=True,
-            is_recent=True,
-            is_kids_content=True,
-            is_kids_query=True,
-        )
-        assert rating == "Excellent"
+    @pytest.mark.parametrize("flags", [-1, 64])
+    def test_flag_table_rejects_out_of_range(self, flags):
+        """Flags outside the six-bit range raise instead of wrapping."""
+        with pytest.raises(ValueError):
+            rate_browse_index(flags)
 
 
 class TestSimilarityRating:
     """Test Similarity query rating logic."""
 
-    def test_all_three_match_excellent(self):
-        """3/3 categories = Excellent."""
+    @pytest.mark.parametrize(
+        "result_title,target_audience,factual,theme,expected",
+        [
+            pytest.param("Her", True, True, True, "Excellent", id="all_three_match_excellent"),
+            pytest.param("Her", True, True, False, "Good", id="two_match_good"),
+            pytest.param("Blacksad", False, True, False, "Acceptable", id="one_match_acceptable"),
+            pytest.param("Just Go with It", False, False, False, "Off-Topic", id="no_match_off_topic"),
+        ],
+    )
+    def test_similarity(self, result_title, target_audience, factual, theme, expected):
+        """3/3 = Excellent, 2/3 = Good, factual alone = Acceptable, 0/3 = Off-Topic."""
         rating = rate_similarity(
             query="movies like ex machina",
-            result_title="Her",
+            result_title=result_title,
             seed_title="Ex Machina",
-            target_audience_match=True,
-            factual_match=True,
-            theme_match=True,
+            target_audience_match=target_audience,
+            factual_match=factual,
+            theme_match=theme,
         )
-        assert rating == "Excellent"
-
-    def test_two_match_good(self):
-        """2/3 categories = Good."""
-        rating = rate_similarity(
-            query="movies like ex machina",
-            result_title="Her",
-            seed_title="Ex Machina",
-            target_audience_match=True,
-            factual_match=True,
-            theme_match=False,
-        )
-        assert rating == "Good"
-
-    def test_one_match_acceptable(self):
-        """1/3 categories = Acceptable."""
-        rating = rate_similarity(
-            query="movies like ex machina",
-            result_title="Blacksad",
-            seed_title="Ex Machina",
-            target_audience_match=False,
-            factual_match=True,
-            theme_match=False,
-        )
-        assert rating == "Acceptable"
-
-    def test_no_match_off_topic(self):
-        """0/3 categories = Off-Topic."""
-        rating = rate_similarity(
-            query="movies like ex machina",
-            result_title="Just Go with It",
-            seed_title="Ex Machina",
-            target_audience_match=False,
-            factual_match=False,
-            theme_match=False,
-        )
-        assert rating == "Off-Topic"
+        assert rating == expected
 
 
 class TestNavigationalRating:
     """Test Navigational query rating logic."""
 
-    def test_exact_match_perfect(self):
-        """Exact match = Perfect."""
-        rating = rate_navigational(
-            query="jurassic park movie",
-            result_title="Jurassic Park",
-            disambiguation="Jurassic Park (1993)",
-            is_exact_match=True,
-        )
-        assert rating == "Perfect"
-
-    def test_sequel_prequel_excellent(self):
-        """Sequel/prequel = Excellent."""
-        rating = rate_navigational(
-            query="jurassic park movies",
-            result_title="Jurassic World",
-            disambiguation="Jurassic Park",
-            is_exact_match=False,
-            is_sequel_prequel=True,
-        )
-        assert rating == "Excellent"
-
-    def test_person_card_for_actor_query_excellent(self):
-        """Person card for actor query = Excellent (calibration exception)."""
-        rating = rate_navigational(
-            query="movies starring emma watson",
-            result_title="Emma Watson",
-            disambiguation=None,
-            is_exact_match=False,
-            is_person_card=True,
-            is_actor_query=True,
-        )
-        assert rating == "Excellent"
-
-    def test_navigational_miss_shared_attributes_acceptable(self):
-        """Navigational miss with shared attributes = Acceptable (calibration exception)."""
-        rating = rate_navigational(
-            query="old movie with eddie murphy in new york",
-            result_title="Beverly Hills Cop",
-            disambiguation="Coming to America (1988)",
-            is_exact_match=False,
-            shared_attributes=2,  # same actor + same genre
-        )
-        assert rating == "Acceptable"
-
-    def test_navigational_miss_no_attributes_off_topic(self):
-        """Navigational miss with no shared attributes = Off-Topic."""
-        rating = rate_navigational(
-            query="that movie with the blue people",
-            result_title="Good Luck Chuck",
-            disambiguation="Avatar",
-            is_exact_match=False,
-            shared_attributes=0,
-        )
-        assert rating == "Off-Topic"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                # Exact match = Perfect.
+                dict(query="jurassic park movie", result_title="Jurassic Park",
+                     disambiguation="Jurassic Park (1993)", is_exact_match=True),
+                "Perfect",
+                id="exact_match_perfect",
+            ),
+            pytest.param(
+                # Sequel/prequel = Excellent.
+                dict(query="jurassic park movies", result_title="Jurassic World",
+                     disambiguation="Jurassic Park", is_exact_match=False, is_sequel_prequel=True),
+                "Excellent",
+                id="sequel_prequel_excellent",
+            ),
+            pytest.param(
+                # Person card for actor query = Excellent (calibration exception).
+                dict(query="movies starring emma watson", result_title="Emma Watson",
+                     disambiguation=None, is_exact_match=False, is_person_card=True,
+                     is_actor_query=True),
+                "Excellent",
+                id="person_card_for_actor_query_excellent",
+            ),
+            pytest.param(
+                # Navigational miss with shared attributes (same actor + same genre)
+                # = Acceptable (calibration exception).
+                dict(query="old movie with eddie murphy in new york", result_title="Beverly Hills Cop",
+                     disambiguation="Coming to America (1988)", is_exact_match=False,
+                     shared_attributes=2),
+                "Acceptable",
+                id="navigational_miss_shared_attributes_acceptable",
+            ),
+            pytest.param(
+                # Navigational miss with no shared attributes = Off-Topic.
+                dict(query="that movie with the blue people", result_title="Good Luck Chuck",
+                     disambiguation="Avatar", is_exact_match=False, shared_attributes=0),
+                "Off-Topic",
+                id="navigational_miss_no_attributes_off_topic",
+            ),
+        ],
+    )
+    def test_navigational(self, kwargs, expected):
+        """Navigational rating matrix and calibration exceptions."""
+        assert rate_navigational(**kwargs) == expected
 
 
 class TestDetectors:
     """Test detection helper functions."""
 
-    def test_detect_time_period_query_80s(self):
-        """Detect 80s time period query."""
-        is_tp, period = detect_time_period_query("best 80s movies")
-        assert is_tp is True
-        assert period == (1980, 1989)
-
-    def test_detect_time_period_query_1980s(self):
-        """Detect 1980s time period query."""
-        is_tp, period = detect_time_period_query("action movies from the 1980s")
-        assert is_tp is True
-        assert period == (1980, 1989)
-
-    def test_detect_time_period_query_none(self):
-        """No time period in query."""
-        is_tp, period = detect_time_period_query("best action movies")
-        assert is_tp is False
-        assert period is None
-
-    def test_detect_actor_query_starring(self):
-        """Detect actor query with 'starring'."""
-        assert detect_actor_query("movies starring tom hanks") is True
-
-    def test_detect_actor_query_with(self):
-        """Detect actor query with 'movies with'."""
-        assert detect_actor_query("movies with tom hanks") is True
-
-    def test_detect_kids_content_age(self):
-        """Detect kids content by age rating."""
-        assert detect_kids_content("7+", None) is True
-        assert detect_kids_content("13+", None) is False
-
-    def test_detect_kids_content_rating(self):
-        """Detect kids content by content rating."""
-        assert detect_kids_content(None, "G") is True
-        assert detect_kids_content(None, "R") is False
-
-    def test_detect_kids_query(self):
-        """Detect kids-specific query."""
-        assert detect_kids_query("animated movies for kids") is True
-        assert detect_kids_query("action movies") is False
+    @pytest.mark.parametrize(
+        "detector,args,expected",
+        [
+            pytest.param(detect_time_period_query, ("best 80s movies",), (True, (1980, 1989)),
+                         id="time_period_query_80s"),
+            pytest.param(detect_time_period_query, ("action movies from the 1980s",), (True, (1980, 1989)),
+                         id="time_period_query_1980s"),
+            pytest.param(detect_time_period_query, ("best action movies",), (False, None),
+                         id="time_period_query_none"),
+            pytest.param(detect_actor_query, ("movies starring tom hanks",), True, id="actor_query_starring"),
+            pytest.param(detect_actor_query, ("movies with tom hanks",), True, id="actor_query_with"),
+            pytest.param(detect_kids_content, ("7+", None), True, id="kids_content_age"),
+            pytest.param(detect_kids_content, ("13+", None), False, id="kids_content_age_teen"),
+            pytest.param(detect_kids_content, (None, "G"), True, id="kids_content_rating"),
+            pytest.param(detect_kids_content, (None, "R"), False, id="kids_content_rating_r"),
+            pytest.param(detect_kids_query, ("animated movies for kids",), True, id="kids_query"),
+            pytest.param(detect_kids_query, ("action movies",), False, id="kids_query_none"),
+        ],
+    )
+    def test_detector(self, detector, args, expected):
+        """Detectors return the expected flag (and decade range)."""
+        result = detector(*args)
+        if isinstance(expected, tuple):
+            is_match, period = result
+            assert is_match is expected[0]
+            assert period == expected[1]
+        else:
+            assert result is expected
 
 
 class TestReasoning:
@@ -1,4 +1,5 @@
 import os
+import shutil
 
 from tools.media_hint_eval.extract import extract_cache
 from tools.media_hint_eval.utils import read_jsonl
@@ -17,3 +18,24 @@ def test_extract_cache(tmp_path):
     assert by_id["task-1"]["official_title"] == "Spider-Man: Homecoming"
     assert by_id["task-2"]["official_title"] == "Schindler's List"
     assert by_id["task-3"]["content_type"] == "movie"
+
+
+def test_extract_cache_reuses_features_until_inputs_change(tmp_path):
+    cache_dir = tmp_path / "cache"
+    shutil.copytree(FIXTURE_CACHE, cache_dir)
+    fresh_path = tmp_path / "fresh.jsonl"
+    extract_cache(FIXTURE_CACHE, str(fresh_path))
+
+    for name in ("first.jsonl", "second.jsonl"):
+        extract_cache(str(cache_dir), str(tmp_path / name), reuse_cached=True)
+        assert read_jsonl(str(tmp_path / name)) == read_jsonl(str(fresh_path))
+    cached = [name for name in os.listdir(cache_dir / "task-1") if name.startswith("_features_cache_")]
+    assert len(cached) == 1
+
+    task_path = cache_dir / "task-1" / "task.json"
+    task_path.write_text(task_path.read_text(encoding="utf-8").replace("Spider", "Spyder"), encoding="utf-8")
+    extract_cache(str(cache_dir), str(tmp_path / "third.jsonl"), reuse_cached=True)
+    by_id = {row["task_id"]: row for row in read_jsonl(str(tmp_path / "third.jsonl"))}
+    assert by_id["task-1"]["result"] == "Spyder Man"
+    cached = [name for name in os.listdir(cache_dir / "task-1") if name.startswith("_features_cache_")]
+    assert len(cached) == 1
@@ -0,0 +1,96 @@
+import asyncio
+import json
+
+import pytest
+
+from tools.media_hint_eval.cli import build_parser
+from tools.media_hint_eval.fetch import (
+    _collect_link,
+    _detect_blocked_page,
+    _extract_google_imdb_urls,
+    _extract_imdb_candidate_urls,
+)
+
+
+def test_imdb_candidate_urls_from_hrefs():
+    html = (
+        '<a href="/title/tt2250912/?ref_=fn_al_tt_1">Spider-Man: Homecoming</a>'
+        '<a href="/name/nm4043618/">Tom Holland</a>'
+        '<a href="/title/tt2250912/">Spider-Man: Homecoming</a>'
+        '<a href="/chart/top/">Top 250</a>'
+    )
+    assert _extract_imdb_candidate_urls(html) == (
+        "https://www.imdb.com/title/tt2250912/",
+        "https://www.imdb.com/name/nm4043618/",
+    )
+
+
+def test_google_imdb_urls_from_html():
+    html = (
+        'href="https://www.imdb.com/title/tt0108052/" '
+        'href="https://www.imdb.com/title/tt0108052/" '
+        'href="http://www.imdb.com/name/nm0000229/"'
+    )
+    assert _extract_google_imdb_urls(html) == (
+        "https://www.imdb.com/title/tt0108052/",
+        "https://www.imdb.com/name/nm0000229/",
+    )
+
+
+def test_blocked_page_markers():
+    assert _detect_blocked_page("https://www.google.com/sorry/index", "Our systems have detected Unusual Traffic")
+    assert _detect_blocked_page("https://www.youtube.com/watch", "<div>ReCAPTCHA</div>")
+    assert _detect_blocked_page("https://consent.google.com/ml", "<html></html>")
+    assert not _detect_blocked_page("https://www.google.com/search", "<h3>Spider-Man</h3>")
+    assert not _detect_blocked_page("https://www.imdb.com/title/tt2250912/", "captcha")
+
+
+class _FailingPage:
+    """Pooled page still showing an earlier link; every real fetch fails."""
+
+    def __init__(self):
+        self.url = "https://www.imdb.com/title/tt0000001/"
+        self.screenshots = []
+
+    async def goto(self, url, **kwargs):
+        if url != "about:blank":
+            raise RuntimeError("net::ERR_NAME_NOT_RESOLVED")
+        self.url = url
+
+    async def screenshot(self, path, **kwargs):
+        self.screenshots.append(path)
+
+
+def test_failed_link_does_not_report_previous_page(tmp_path):
+    page = _FailingPage()
+    meta_path = tmp_path / "result_imdb.json"
+    result = asyncio.run(_collect_link(
+        page,
+        "https://tinyurl.com/missing",
+        meta_path=str(meta_path),
+        html_path=str(tmp_path / "result_imdb.html"),
+        screenshot_path=str(tmp_path / "result_imdb.png"),
+        timeout_ms=1000,
+        retries=0,
+    ))
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    assert result["html"] is None
+    assert meta["final_url"] is None
+    assert meta["screenshot_path"] is None
+    assert meta["page_status"] == "error"
+    assert page.screenshots == []
+
+
+@pytest.mark.parametrize("option", ["--concurrency", "--per-host-concurrency"])
+@pytest.mark.parametrize("value", ["0", "-1", "two"])
+def test_collect_rejects_non_positive_concurrency(option, value):
+    parser = build_parser("collect")
+    with pytest.raises(SystemExit):
+        parser.parse_args(["collect", "--cache-dir", "cache", "--input", "tasks.jsonl", option, value])
+
+
+def test_collect_per_host_concurrency_defaults_to_uncapped():
+    parser = build_parser("collect")
+    args = parser.parse_args(["collect", "--cache-dir", "cache", "--input", "tasks.jsonl"])
+    assert args.concurrency == 4
+    assert args.per_host_concurrency is None
@@ -1,7 +1,7 @@
 import os
 
-from tools.media_hint_eval.schemas import Features
-from tools.media_hint_eval.score import detect_mode, score_features
+from tools.media_hint_eval.schemas import Features, ScoreOutput
+from tools.media_hint_eval.score import detect_mode, memoized_scorer, score_features, score_features_batch
 from tools.media_hint_eval.utils import load_yaml
 
 
@@ -345,3 +345,92 @@ def test_alt_exists_when_votes_high():
     assert output.debug.features["dominance_ratio"] < 0.5
     assert output.debug.features["alternative_exists"] is True
     assert "alternative exists" in output.comment
+
+
+def test_memoized_scorer_matches_direct_scoring():
+    config = load_yaml(CONFIG_PATH)
+    base = Features(
+        task_id="m1",
+        query="schindlers list",
+        result="Schindler's List",
+        official_title="Schindler's List",
+        content_type="movie",
+        imdb_votes=1500000,
+        imdb_rating=8.9,
+        query_candidates=["Schindler's List"],
+        result_imdb_ok=True,
+    )
+    score = memoized_scorer(config)
+    for task_id in ("m1", "m2", "m1"):
+        features = base.model_copy(update={"task_id": task_id})
+        assert score(features).model_dump() == score_features(features, config).model_dump()
+
+
+def test_memoized_scorer_returns_independent_outputs():
+    config = load_yaml(CONFIG_PATH)
+    features = Features(
+        task_id="c1",
+        query="schindlers list",
+        result="Schindler's List",
+        official_title="Schindler's List",
+        content_type="movie",
+        result_imdb_ok=True,
+    )
+    score = memoized_scorer(config)
+    first = score(features)
+    first.debug.features["query"] = "mutated"
+    second = score(features)
+    assert second.debug.features["query"] == "schindlers list"
+    second.debug.gates.clear()
+    assert score(features).model_dump() == score_features(features, config).model_dump()
+
+
+def test_memoized_scorer_keys_on_every_field():
+    config = load_yaml(CONFIG_PATH)
+    features = Features(task_id="k1", query="inter", result="Interstellar", official_title="Interstellar")
+    score = memoized_scorer(config)
+    score(features)
+    changed = features.model_copy(update={"errors": ["fetch failed"]})
+    assert score(changed).debug.features["errors"] == ["fetch failed"]
+
+
+def test_score_features_batch_matches_direct_scoring():
+    config = load_yaml(CONFIG_PATH)
+    base = Features(
+        task_id="b1",
+        query="inter",
+        result="Interstellar",
+        official_title="Interstellar",
+        content_type="movie",
+        imdb_votes=2000000,
+        imdb_rating=8.7,
+        query_candidates=["Interstellar"],
+        result_imdb_ok=True,
+    )
+    batch = [
+        base,
+        base.model_copy(update={"task_id": "b2"}),
+        base.model_copy(update={"task_id": "b3", "result": "Inter Stellar"}),
+    ]
+    outputs = score_features_batch(batch, config)
+    assert [output.model_dump() for output in outputs] == [
+        score_features(features, config).model_dump() for features in batch
+    ]
+
+
+def test_score_output_matches_validated_model():
+    config = load_yaml(CONFIG_PATH)
+    scored = Features(
+        task_id="v1",
+        query="inter",
+        result="Interstellar",
+        official_title="Interstellar",
+        content_type="movie",
+        imdb_votes=2000000,
+        imdb_rating=8.7,
+        result_imdb_ok=True,
+    )
+    gated = scored.model_copy(update={"task_id": "v2", "result_imdb_ok": False, "official_title": None})
+    for features in (scored, gated):
+        output = score_features(features, config)
+        assert ScoreOutput.model_validate(output.model_dump()) == output
@@ -2,8 +2,8 @@ import os
 import pytest
 import math
 
-from tools.media_hint_eval.cli import _compute_metrics
-from tools.media_hint_eval.utils import read_jsonl
+from tools.media_hint_eval.fit import compute_metrics, format_metrics
+from tools.media_hint_eval.utils import load_yaml_cached, read_jsonl, write_jsonl
 
 
 def test_read_jsonl_skips_blank_lines():
@@ -25,10 +25,32 @@ def test_read_jsonl_reports_line_numbers(tmp_path):
     assert "{bad json}" in message
 
 
+def test_read_jsonl_reads_nan_written_by_write_jsonl(tmp_path):
+    path = tmp_path / "features.jsonl"
+    write_jsonl(str(path), [{"imdb_rating": float("nan")}, {"imdb_rating": 7.5}])
+
+    rows = read_jsonl(str(path))
+    assert math.isnan(rows[0]["imdb_rating"])
+    assert rows[1]["imdb_rating"] == 7.5
+
+
+def test_load_yaml_cached_returns_copies_and_sees_edits(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("thresholds:\n  good: 0.7\n", encoding="utf-8")
+
+    first = load_yaml_cached(str(path))
+    first["thresholds"]["good"] = 0.1
+    assert load_yaml_cached(str(path))["thresholds"]["good"] == 0.7
+
+    path.write_text("thresholds:\n  good: 0.6\n", encoding="utf-8")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+    assert load_yaml_cached(str(path))["thresholds"]["good"] == 0.6
+
+
 def test_metrics_include_problem_other():
     labels = ["Perfect", "Good"]
     preds = ["Problem: Other", "Problem: Other"]
-    metrics = _compute_metrics(preds, labels)
+    metrics = compute_metrics(preds, labels)
     assert "Problem: Other" in metrics["confusion"]
     assert metrics["confusion"]["Problem: Other"]["Problem: Other"] == 0
     assert metrics["confusion"]["Perfect"]["Problem: Other"] == 1
@@ -37,8 +59,14 @@ def test_metrics_include_problem_other():
 def test_metrics_support_only_macro_f1():
     labels = ["Acceptable", "Unacceptable: Spelling", "Unacceptable: Concerns"]
     preds = ["Acceptable", "Unacceptable: Spelling", "Unacceptable: Concerns"]
-    metrics = _compute_metrics(preds, labels)
+    metrics = compute_metrics(preds, labels)
     assert math.isclose(metrics["accuracy"], 1.0, rel_tol=1e-6)
     assert math.isclose(metrics["macro_f1"], 3 / 7, rel_tol=1e-6)
     assert math.isclose(metrics["macro_f1_all_labels"], 3 / 7, rel_tol=1e-6)
     assert math.isclose(metrics["macro_f1_support_only"], 1.0, rel_tol=1e-6)
+
+
+def test_format_metrics_reports_accuracy():
+    metrics = compute_metrics(["Perfect", "Good"], ["Perfect", "Perfect"])
+    assert metrics["correct"] == 1
+    assert "Accuracy: 0.500 (1/2)" in format_metrics(metrics)
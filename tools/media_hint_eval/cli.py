@@ -1,100 +1,18 @@
 import argparse
-import os
-from collections import Counter, defaultdict
+import sys
+from functools import lru_cache
 
 from .extract import extract_cache
-from .fetch import collect
-from .fit import fit_thresholds
-from .schemas import Features, LabeledFeature
-from .score import LABELS, score_features
-from .utils import load_yaml, read_jsonl, safe_filename, write_jsonl
-
-
-def _load_features(path: str):
-    rows = read_jsonl(path)
-    return [Features.model_validate(row) for row in rows]
-
-
-def _load_labeled(path: str):
-    rows = read_jsonl(path)
-    labeled = []
-    for row in rows:
-        labeled.append(LabeledFeature.model_validate(row))
-    return labeled
-
-
-def _label_of(entry: LabeledFeature) -> str:
-    return entry.label or entry.rating or ""
-
-
-def _compute_metrics(preds, labels):
-    total = len(labels)
-    correct = sum(1 for p, l in zip(preds, labels) if p == l)
-    accuracy = correct / total if total else 0.0
-
-    labels_set = sorted(set(labels) | set(preds) | set(LABELS))
-    counts = Counter(labels)
-    for label in labels_set:
-        counts.setdefault(label, 0)
-    confusion = {label: Counter() for label in labels_set}
-    for pred, label in zip(preds, labels):
-        confusion[label][pred] += 1
-    for label in labels_set:
-        for pred_label in labels_set:
-            confusion[label].setdefault(pred_label, 0)
-
-    f1_scores = []
-    f1_support_scores = []
-    for label in labels_set:
-        tp = confusion[label][label]
-        fp = sum(confusion[other].get(label, 0) for other in labels_set if other != label)
-        fn = sum(confusion[label].get(other, 0) for other in labels_set if other != label)
-        precision = tp / (tp + fp) if (tp + fp) else 0.0
-        recall = tp / (tp + fn) if (tp + fn) else 0.0
-        f1 = (2 * precision * recall / (precision + recall)) if (precision + recall) else 0.0
-        f1_scores.append(f1)
-        if counts.get(label, 0) > 0:
-            f1_support_scores.append(f1)
-    macro_f1 = sum(f1_scores) / len(f1_scores) if f1_scores else 0.0
-    macro_f1_support_only = (
-        sum(f1_support_scores) / len(f1_support_scores) if f1_support_scores else 0.0
-    )
-
-    return {
-        "accuracy": accuracy,
-        "macro_f1": macro_f1,
-        "macro_f1_all_labels": macro_f1,
-        "macro_f1_support_only": macro_f1_support_only,
-        "total": total,
-        "counts": dict(counts),
-        "confusion": {k: dict(v) for k, v in confusion.items()},
-    }
-
-
-def _format_metrics(metrics):
-    lines = []
-    correct = 0
-    for label, counts in metrics["confusion"].items():
-        correct += counts.get(label, 0)
-    lines.append(f"Accuracy: {metrics['accuracy']:.3f} ({correct}/{metrics['total']})")
-    lines.append(f"Macro-F1: {metrics['macro_f1']:.3f}")
-    lines.append(f"Macro-F1 (support-only): {metrics['macro_f1_support_only']:.3f}")
-    lines.append("Label counts:")
-    for label, count in sorted(metrics["counts"].items()):
-        lines.append(f"  {label}: {count}")
-    lines.append("Confusion matrix:")
-    labels = sorted(metrics["counts"].keys())
-    header = "true\\pred," + ",".join(labels)
-    lines.append(header)
-    for label in labels:
-        row = [label]
-        for pred in labels:
-            row.append(str(metrics["confusion"].get(label, {}).get(pred, 0)))
-        lines.append(",".join(row))
-    return "\n".join(lines)
+from .fit import compute_metrics, features_from_labeled, fit_thresholds, format_metrics, load_labeled
+from .schemas import Features
+from .score import memoized_scorer, score_features_batch
+from .utils import load_yaml_cached, read_jsonl, read_jsonl_iter, write_jsonl
 
 
 def cmd_collect(args):
+    # Imported here: playwright dominates import time and only collect needs it.
+    from .fetch import collect
+
     collect(
         input_path=args.input,
         cache_dir=args.cache_dir,
@@ -104,17 +22,22 @@ def cmd_collect(args):
         timeout_ms=args.timeout_ms,
         retries=args.retries,
         user_agent=args.user_agent,
+        concurrency=args.concurrency,
+        per_host_concurrency=args.per_host_concurrency,
     )
 
 
 def cmd_extract(args):
-    extract_cache(cache_dir=args.cache_dir, out_path=args.out)
+    extract_cache(cache_dir=args.cache_dir, out_path=args.out, reuse_cached=args.reuse_features)
 
 
 def cmd_score(args):
-    features_list = _load_features(args.features)
-    config = load_yaml(args.config)
-    outputs = [score_features(features, config).model_dump() for features in features_list]
+    score = memoized_scorer(load_yaml_cached(args.config))
+    # Parse, score and write one row at a time so memory stays flat.
+    outputs = (
+        score(Features.model_validate(row)).model_dump()
+        for row in read_jsonl_iter(args.features)
+    )
     write_jsonl(args.out, outputs)
 
 
@@ -124,34 +47,19 @@ def cmd_fit(args):
 
 
 def cmd_eval(args):
-    labeled = _load_labeled(args.labeled)
-    config = load_yaml(args.config)
-
-    preds = []
-    labels = []
-    for entry in labeled:
-        label = _label_of(entry)
-        labels.append(label)
-        if entry.features:
-            features = entry.features
-        else:
-            if not args.cache_dir:
-                raise ValueError("cache_dir is required when labeled entries do not include features")
-            task_dir = os.path.join(args.cache_dir, safe_filename(entry.task_id))
-            from .extract import extract_task
-            features = extract_task(task_dir)
-            if not features:
-                raise ValueError(f"missing cached features for task_id={entry.task_id}")
-        preds.append(score_features(features, config).rating)
-
-    metrics = _compute_metrics(preds, labels)
-    print(_format_metrics(metrics))
+    labeled = load_labeled(args.labeled)
+    config = load_yaml_cached(args.config)
+
+    features_list, labels = features_from_labeled(labeled, args.cache_dir)
+    preds = [output.rating for output in score_features_batch(features_list, config)]
+
+    metrics = compute_metrics(preds, labels)
+    print(format_metrics(metrics))
 
 
 def cmd_join(args):
     labeled_rows = read_jsonl(args.labeled)
-    features_rows = read_jsonl(args.features)
-    features = {row["task_id"]: row for row in features_rows}
+    features = {row["task_id"]: row for row in read_jsonl_iter(args.features)}
 
     output_rows = []
     for row in labeled_rows:
@@ -170,13 +78,40 @@ def cmd_join(args):
     write_jsonl(args.out, output_rows)
 
 
-def build_parser():
-    parser = argparse.ArgumentParser(prog="hint_eval")
-    sub = parser.add_subparsers(dest="command", required=True)
+def _positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+# Options shared by several subcommands live on add_help=False parent
+# parsers, built once and passed via parents=[...].
+@lru_cache(maxsize=None)
+def _cache_dir_parent(required):
+    parent = argparse.ArgumentParser(add_help=False)
+    if required:
+        parent.add_argument("--cache-dir", required=True)
+    else:
+        parent.add_argument("--cache-dir", default=None,
+                            help="Cache directory for labeled tasks without features")
+    return parent
+
+
+@lru_cache(maxsize=None)
+def _out_parent():
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--out", required=True)
+    return parent
+
 
-    collect_parser = sub.add_parser("collect", help="Collect HTML for tasks")
+def _add_collect_parser(sub):
+    collect_parser = sub.add_parser("collect", parents=[_cache_dir_parent(True)],
+                                    help="Collect HTML for tasks")
     collect_parser.add_argument("--input", required=True)
-    collect_parser.add_argument("--cache-dir", required=True)
     collect_parser.add_argument("--screenshot", action="store_true")
     collect_parser.add_argument("--force", action="store_true")
     collect_parser.add_argument("--collect-alternatives", action="store_true",
@@ -184,47 +119,82 @@ def build_parser():
     collect_parser.add_argument("--timeout-ms", type=int, default=30000)
     collect_parser.add_argument("--retries", type=int, default=2)
     collect_parser.add_argument("--user-agent", default=None)
+    collect_parser.add_argument("--concurrency", type=_positive_int, default=4,
+                                help="Browser pages fetching in parallel")
+    collect_parser.add_argument("--per-host-concurrency", type=_positive_int, default=None,
+                                help="Cap on parallel fetches per link host (default: no cap)")
     collect_parser.set_defaults(func=cmd_collect)
 
-    extract_parser = sub.add_parser("extract", help="Extract features from cached HTML")
-    extract_parser.add_argument("--cache-dir", required=True)
-    extract_parser.add_argument("--out", required=True)
+
+def _add_extract_parser(sub):
+    extract_parser = sub.add_parser("extract", parents=[_cache_dir_parent(True), _out_parent()],
+                                    help="Extract features from cached HTML")
+    extract_parser.add_argument("--reuse-features", action="store_true",
+                                help="Reuse per-task features cached from an earlier run with unchanged inputs")
     extract_parser.set_defaults(func=cmd_extract)
 
-    score_parser = sub.add_parser("score", help="Score features and output labels")
+
+def _add_score_parser(sub):
+    score_parser = sub.add_parser("score", parents=[_out_parent()],
+                                  help="Score features and output labels")
     score_parser.add_argument("--features", required=True)
     score_parser.add_argument("--config", required=True)
-    score_parser.add_argument("--out", required=True)
     score_parser.set_defaults(func=cmd_score)
 
-    fit_parser = sub.add_parser("fit", help="Fit thresholds on labeled data")
+
+def _add_fit_parser(sub):
+    fit_parser = sub.add_parser("fit", parents=[_cache_dir_parent(False)],
+                                help="Fit thresholds on labeled data")
     fit_parser.add_argument("--train", required=True)
     fit_parser.add_argument("--config-in", required=True)
     fit_parser.add_argument("--config-out", required=True)
-    fit_parser.add_argument("--cache-dir", default=None,
-                            help="Cache directory for labeled tasks without features")
     fit_parser.set_defaults(func=cmd_fit)
 
-    eval_parser = sub.add_parser("eval", help="Evaluate labeled data")
+
+def _add_eval_parser(sub):
+    eval_parser = sub.add_parser("eval", parents=[_cache_dir_parent(False)],
+                                 help="Evaluate labeled data")
     eval_parser.add_argument("--labeled", required=True)
     eval_parser.add_argument("--config", required=True)
-    eval_parser.add_argument("--cache-dir", default=None,
-                             help="Cache directory for labeled tasks without features")
     eval_parser.set_defaults(func=cmd_eval)
 
-    join_parser = sub.add_parser("join", help="Join labeled JSONL with features by task_id")
+
+def _add_join_parser(sub):
+    join_parser = sub.add_parser("join", parents=[_out_parent()],
+                                 help="Join labeled JSONL with features by task_id")
     join_parser.add_argument("--labeled", required=True)
     join_parser.add_argument("--features", required=True)
-    join_parser.add_argument("--out", required=True)
     join_parser.add_argument("--label-field", default="gold_rating")
     join_parser.set_defaults(func=cmd_join)
 
+
+COMMANDS = {
+    "collect": _add_collect_parser,
+    "extract": _add_extract_parser,
+    "score": _add_score_parser,
+    "fit": _add_fit_parser,
+    "eval": _add_eval_parser,
+    "join": _add_join_parser,
+}
+
+
+def build_parser(command=None):
+    parser = argparse.ArgumentParser(prog="hint_eval")
+    sub = parser.add_subparsers(dest="command", required=True)
+    if command in COMMANDS:
+        COMMANDS[command](sub)
+    else:
+        for add_parser in COMMANDS.values():
+            add_parser(sub)
     return parser
 
 
-def main():
-    parser = build_parser()
-    args = parser.parse_args()
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # Only the chosen subcommand's parser is built; top-level help and
+    # unknown commands still get the full parser.
+    parser = build_parser(argv[0] if argv else None)
+    args = parser.parse_args(argv)
     args.func(args)
 
 
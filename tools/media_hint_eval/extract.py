@@ -1,13 +1,16 @@
+import hashlib
 import json
 import math
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .schemas import AlternativeCandidate, Features, TaskInput
-from .utils import read_jsonl, write_jsonl
+from .utils import HTML_PARSER, _json_loads, read_jsonl, write_jsonl
 
 
 IMDB_TYPE_MAP = {
@@ -19,31 +22,41 @@ IMDB_TYPE_MAP = {
     "person": "person",
 }
 
+_YEAR_PREFIX_RE = re.compile(r"(\d{4})")
+# "(2019)", "(2019-2023)", "(2019–)" or a bare "2019-2023" range.
+_YEAR_RANGE_RE = re.compile(r"\((\d{4})(?:[–\-](\d{4})?)?(?:\s*\))|\b(\d{4})[–\-](\d{4})?\b")
+_STARMETER_RE = re.compile(r"STARmeter\s*([0-9,]+)", re.IGNORECASE)
 
-def _load_meta(task_dir: str, key: str) -> Optional[dict]:
-    path = os.path.join(task_dir, f"{key}.json")
-    if not os.path.exists(path):
+# Candidate helpers only look at these tags, so the rest of the page is not
+# built into the tree.
+_H3_STRAINER = SoupStrainer("h3")
+_A_HREF_STRAINER = SoupStrainer("a", href=True)
+
+
+# `present` is the task directory's listing, so existence checks need no stat.
+def _load_meta(task_dir: str, key: str, present: FrozenSet[str]) -> Optional[dict]:
+    name = f"{key}.json"
+    if name not in present:
         return None
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with open(os.path.join(task_dir, name), "rb") as handle:
+        return _json_loads(handle.read())
 
 
-def _load_html(task_dir: str, key: str) -> Optional[str]:
-    path = os.path.join(task_dir, f"{key}.html")
-    if not os.path.exists(path):
+def _load_html(task_dir: str, key: str, present: FrozenSet[str]) -> Optional[str]:
+    name = f"{key}.html"
+    if name not in present:
         return None
-    with open(path, "r", encoding="utf-8") as handle:
+    with open(os.path.join(task_dir, name), "r", encoding="utf-8") as handle:
         return handle.read()
 
 
-def _parse_json_ld(html: str) -> Optional[dict]:
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_json_ld(soup: BeautifulSoup) -> Optional[dict]:
     scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
     for script in scripts:
         if not script.string:
             continue
         try:
-            data = json.loads(script.string.strip())
+            data = _json_loads(script.string.strip())
         except json.JSONDecodeError:
             continue
         if isinstance(data, list):
@@ -74,7 +87,10 @@ def _extract_imdb(html: str, url: Optional[str] = None) -> Dict[str, Optional[ob
         is_person_page = True
         data["content_type"] = "person"
 
-    json_ld = _parse_json_ld(html)
+    # One parse serves JSON-LD, og:title/<title> and the person-page probes.
+    soup = BeautifulSoup(html, HTML_PARSER)
+    # Substring probes skip tree searches for markup the page cannot contain.
+    json_ld = _parse_json_ld(soup) if "application/ld+json" in html else None
     if json_ld:
         raw_type = str(json_ld.get("@type", "")).lower()
         detected_type = IMDB_TYPE_MAP.get(raw_type, "unknown")
@@ -101,18 +117,16 @@ def _extract_imdb(html: str, url: Optional[str] = None) -> Dict[str, Optional[ob
         # Extract release year from datePublished (format: "YYYY-MM-DD" or "YYYY")
         date_published = json_ld.get("datePublished")
         if date_published and isinstance(date_published, str):
-            year_match = re.match(r"(\d{4})", date_published)
+            year_match = _YEAR_PREFIX_RE.match(date_published)
             if year_match:
                 try:
                     data["release_year"] = int(year_match.group(1))
                 except ValueError:
                     pass
 
-    soup = BeautifulSoup(html, "html.parser")
-
     # Extract year range from title or HTML (e.g., "2019-2023" or "2019-")
     # This handles series with end dates
-    year_range_match = re.search(r"\((\d{4})(?:[–\-](\d{4})?)?(?:\s*\))|\b(\d{4})[–\-](\d{4})?\b", html[:5000])
+    year_range_match = _YEAR_RANGE_RE.search(html[:5000])
     if year_range_match:
         groups = year_range_match.groups()
         start_year = groups[0] or groups[2]
@@ -127,7 +141,7 @@ def _extract_imdb(html: str, url: Optional[str] = None) -> Dict[str, Optional[ob
                 data["end_year"] = int(end_year)
             except ValueError:
                 pass
-    if data["official_title"] is None:
+    if data["official_title"] is None and "og:title" in html:
         og_title = soup.find("meta", attrs={"property": "og:title"})
         if og_title and og_title.get("content"):
             title = og_title.get("content").replace(" - IMDb", "").strip()
@@ -136,7 +150,7 @@ def _extract_imdb(html: str, url: Optional[str] = None) -> Dict[str, Optional[ob
     if data["official_title"] is None and soup.title and soup.title.string:
         data["official_title"] = soup.title.string.replace(" - IMDb", "").strip()
 
-    starmeter_match = re.search(r"STARmeter\s*([0-9,]+)", html, re.IGNORECASE)
+    starmeter_match = _STARMETER_RE.search(html)
     if starmeter_match:
         try:
             data["starmeter"] = int(starmeter_match.group(1).replace(",", ""))
@@ -157,7 +171,7 @@ def _extract_imdb(html: str, url: Optional[str] = None) -> Dict[str, Optional[ob
 def _extract_google_candidates(html: str, limit: int = 5) -> List[str]:
     if not html:
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_H3_STRAINER)
     candidates = []
     for header in soup.find_all("h3"):
         text = header.get_text(strip=True)
@@ -169,9 +183,9 @@ def _extract_google_candidates(html: str, limit: int = 5) -> List[str]:
 
 
 def _extract_imdb_candidates(html: str, limit: int = 5) -> List[str]:
-    if not html:
+    if not html or ("/title/tt" not in html and "/name/nm" not in html):
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_A_HREF_STRAINER)
     candidates = []
     for anchor in soup.find_all("a", href=True):
         href = anchor.get("href", "")
@@ -190,8 +204,8 @@ def _extract_imdb_candidates(html: str, limit: int = 5) -> List[str]:
 def _extract_google_title(html: str) -> Optional[str]:
     if not html:
         return None
-    soup = BeautifulSoup(html, "html.parser")
-    og_title = soup.find("meta", attrs={"property": "og:title"})
+    soup = BeautifulSoup(html, HTML_PARSER)
+    og_title = soup.find("meta", attrs={"property": "og:title"}) if "og:title" in html else None
     if og_title and og_title.get("content"):
         return og_title.get("content").strip()
     if soup.title and soup.title.string:
@@ -199,21 +213,34 @@ def _extract_google_title(html: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4096)
+def _load_task_at(path: str, mtime_ns: int) -> TaskInput:
+    # pydantic-core parses and validates the bytes in one pass, with no
+    # intermediate dict.
+    with open(path, "rb") as handle:
+        return TaskInput.model_validate_json(handle.read())
+
+
+# Repeat loads of an unchanged task.json (fit then eval, re-extracts) reuse
+# the validated model; callers must not mutate it.
 def _load_task(task_dir: str) -> Optional[TaskInput]:
     path = os.path.join(task_dir, "task.json")
-    if not os.path.exists(path):
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    with open(path, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-    return TaskInput.model_validate(payload)
+    return _load_task_at(path, mtime_ns)
+
 
+_EVIDENCE_KEYS = ("result_imdb", "result_google", "query_google", "query_imdb")
 
-def _best_evidence(task_dir: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], List[str]]:
+
+def _best_evidence(metas: Dict[str, Optional[dict]]) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], List[str]]:
     errors = []
-    result_imdb_meta = _load_meta(task_dir, "result_imdb")
-    result_google_meta = _load_meta(task_dir, "result_google")
-    query_google_meta = _load_meta(task_dir, "query_google")
-    query_imdb_meta = _load_meta(task_dir, "query_imdb")
+    result_imdb_meta = metas["result_imdb"]
+    result_google_meta = metas["result_google"]
+    query_google_meta = metas["query_google"]
+    query_imdb_meta = metas["query_imdb"]
 
     result_imdb_url = result_imdb_meta.get("final_url") if result_imdb_meta else None
     result_google_url = result_google_meta.get("final_url") if result_google_meta else None
@@ -231,17 +258,18 @@ def _best_evidence(task_dir: str) -> Tuple[Optional[str], Optional[str], Optiona
     return result_imdb_url, result_google_url, query_google_url, query_imdb_url, errors
 
 
-def _candidate_popularity(candidate: AlternativeCandidate) -> float:
-    max_votes = 1000000.0
-    rating_weight = 0.4
-    votes_weight = 0.6
-    starmeter_max = 500000.0
+_CANDIDATE_RATING_WEIGHT = 0.4
+_CANDIDATE_VOTES_WEIGHT = 0.6
+_CANDIDATE_STARMETER_MAX = 500000.0
+_CANDIDATE_MAX_VOTES_LOG10 = math.log10(1000000.0)
+
 
+def _candidate_popularity(candidate: AlternativeCandidate) -> float:
     if candidate.content_type == "person":
         if candidate.starmeter is None:
             return 0.0
         rank = float(candidate.starmeter)
-        return max(0.0, 1.0 - min(rank, starmeter_max) / starmeter_max)
+        return max(0.0, 1.0 - min(rank, _CANDIDATE_STARMETER_MAX) / _CANDIDATE_STARMETER_MAX)
 
     rating_score = 0.0
     if candidate.imdb_rating is not None:
@@ -249,17 +277,17 @@ def _candidate_popularity(candidate: AlternativeCandidate) -> float:
 
     votes_score = 0.0
     if candidate.imdb_votes is not None and candidate.imdb_votes > 0:
-        votes_score = min(1.0, math.log10(candidate.imdb_votes) / math.log10(max_votes))
+        votes_score = min(1.0, math.log10(candidate.imdb_votes) / _CANDIDATE_MAX_VOTES_LOG10)
 
-    return (rating_weight * rating_score) + (votes_weight * votes_score)
+    return (_CANDIDATE_RATING_WEIGHT * rating_score) + (_CANDIDATE_VOTES_WEIGHT * votes_score)
 
 
-def _read_alternative_candidates(task_dir: str) -> List[AlternativeCandidate]:
+def _read_alternative_candidates(task_dir: str, present: FrozenSet[str]) -> List[AlternativeCandidate]:
     alternatives = []
     for idx in range(1, 4):
         key = f"alt_imdb_{idx}"
-        html = _load_html(task_dir, key)
-        meta = _load_meta(task_dir, key)
+        html = _load_html(task_dir, key, present)
+        meta = _load_meta(task_dir, key, present)
         if not html or not meta:
             continue
         alt_url = meta.get("final_url")
@@ -289,18 +317,58 @@ def _parse_page_status(meta: Optional[dict], html: Optional[str]) -> Tuple[bool,
     return True, False
 
 
-def extract_task(task_dir: str) -> Optional[Features]:
+_FEATURES_CACHE_PREFIX = "_features_cache_"
+# Bump when extraction output changes so previously cached features are ignored.
+_FEATURES_CACHE_VERSION = 1
+
+
+def _features_digest(task_dir: str, present: FrozenSet[str]) -> str:
+    digest = hashlib.blake2b(f"v{_FEATURES_CACHE_VERSION}".encode(), digest_size=16)
+    for name in sorted(present):
+        if name.startswith(_FEATURES_CACHE_PREFIX) or not name.endswith((".json", ".html")):
+            continue
+        with open(os.path.join(task_dir, name), "rb") as handle:
+            data = handle.read()
+        digest.update(f"\0{name}\0{len(data)}\0".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def extract_task(task_dir: str, reuse_cached: bool = False) -> Optional[Features]:
     task = _load_task(task_dir)
     if not task:
         return None
+    # One listing answers every cache-file existence check below.
+    present = frozenset(os.listdir(task_dir))
+    if not reuse_cached:
+        return _extract_features(task, task_dir, present)
+
+    # Features are cached next to their inputs under a digest of every
+    # task/meta/html file, so any recollected page invalidates the entry.
+    cache_name = f"{_FEATURES_CACHE_PREFIX}{_features_digest(task_dir, present)}.json"
+    cache_path = os.path.join(task_dir, cache_name)
+    if cache_name in present:
+        with open(cache_path, "rb") as handle:
+            return Features.model_validate_json(handle.read())
+    features = _extract_features(task, task_dir, present)
+    with open(cache_path, "w", encoding="utf-8") as handle:
+        handle.write(features.model_dump_json())
+    for name in present:
+        if name.startswith(_FEATURES_CACHE_PREFIX):
+            os.remove(os.path.join(task_dir, name))
+    return features
+
 
-    result_imdb_html = _load_html(task_dir, "result_imdb")
-    result_google_html = _load_html(task_dir, "result_google")
-    query_google_html = _load_html(task_dir, "query_google")
-    query_imdb_html = _load_html(task_dir, "query_imdb")
+def _extract_features(task: TaskInput, task_dir: str, present: FrozenSet[str]) -> Features:
+    result_imdb_html = _load_html(task_dir, "result_imdb", present)
+    result_google_html = _load_html(task_dir, "result_google", present)
+    query_google_html = _load_html(task_dir, "query_google", present)
+    query_imdb_html = _load_html(task_dir, "query_imdb", present)
+    # Each meta file is read once and shared with _best_evidence.
+    metas = {key: _load_meta(task_dir, key, present) for key in _EVIDENCE_KEYS}
 
     # Get result_imdb URL for person page detection
-    result_imdb_meta = _load_meta(task_dir, "result_imdb")
+    result_imdb_meta = metas["result_imdb"]
     result_imdb_url = result_imdb_meta.get("final_url") if result_imdb_meta else None
 
     imdb_data = _extract_imdb(result_imdb_html, result_imdb_url) if result_imdb_html else {}
@@ -317,14 +385,13 @@ def extract_task(task_dir: str) -> Optional[Features]:
     if not query_candidates:
         query_candidates = _extract_google_candidates(query_imdb_html)
 
-    result_imdb_url_from_evidence, result_google_url, query_google_url, query_imdb_url, errors = _best_evidence(task_dir)
-    alternatives = _read_alternative_candidates(task_dir)
+    result_imdb_url_from_evidence, result_google_url, query_google_url, query_imdb_url, errors = _best_evidence(metas)
+    alternatives = _read_alternative_candidates(task_dir, present)
     best_alternative = None
     if alternatives:
         best_alternative = max(alternatives, key=_candidate_popularity)
 
-    # result_imdb_meta already loaded above
-    result_google_meta = _load_meta(task_dir, "result_google")
+    result_google_meta = metas["result_google"]
     result_imdb_ok, result_imdb_blocked = _parse_page_status(result_imdb_meta, result_imdb_html)
     result_google_ok, result_google_blocked = _parse_page_status(result_google_meta, result_google_html)
     # For person pages, having a title and content_type is enough
@@ -363,13 +430,29 @@ def extract_task(task_dir: str) -> Optional[Features]:
     return features
 
 
-def extract_cache(cache_dir: str, out_path: str) -> None:
-    features_rows = []
-    for entry in sorted(os.listdir(cache_dir)):
-        task_dir = os.path.join(cache_dir, entry)
-        if not os.path.isdir(task_dir):
-            continue
-        features = extract_task(task_dir)
-        if features:
-            features_rows.append(features.model_dump())
-    write_jsonl(out_path, features_rows)
+# Below this many tasks, process pool startup costs more than it saves.
+_PARALLEL_EXTRACT_MIN = 32
+
+
+def _iter_extracted(task_dirs: List[str], reuse_cached: bool = False) -> Iterator[Optional[Features]]:
+    extract = partial(extract_task, reuse_cached=reuse_cached)
+    if len(task_dirs) < _PARALLEL_EXTRACT_MIN:
+        yield from map(extract, task_dirs)
+        return
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(task_dirs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(extract, task_dirs, chunksize=chunksize)
+
+
+def _extract_many(task_dirs: List[str]) -> List[Optional[Features]]:
+    return list(_iter_extracted(task_dirs))
+
+
+def extract_cache(cache_dir: str, out_path: str, reuse_cached: bool = False) -> None:
+    # scandir entries carry their type from the directory read, so no extra stat per entry.
+    with os.scandir(cache_dir) as entries:
+        task_entries = sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+    task_dirs = [entry.path for entry in task_entries]
+    # Rows are dumped and written as they arrive rather than collected first.
+    write_jsonl(out_path, (features.model_dump() for features in _iter_extracted(task_dirs, reuse_cached) if features))
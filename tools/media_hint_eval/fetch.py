@@ -1,20 +1,48 @@
+import asyncio
 import json
 import os
 import re
-import time
-from typing import Dict, Optional, Tuple
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 from .schemas import TaskInput
-from .utils import ensure_dir, read_jsonl, safe_filename, utc_now_iso
+from .utils import ensure_dir, orjson, read_jsonl, safe_filename, utc_now_iso
 
 
 DEFAULT_TIMEOUT_MS = 30000
+DEFAULT_CONCURRENCY = 4
+
+_BLOCKED_MARKERS = (
+    "unusual traffic",
+    "detected unusual traffic",
+    "sorry/index",
+    "recaptcha",
+    "before you continue",
+    "verify you are not a robot",
+    "robot check",
+    "captcha",
+)
+# One scan of the page for any marker instead of one substring scan each.
+_BLOCKED_MARKERS_RE = re.compile("|".join(map(re.escape, _BLOCKED_MARKERS)))
+
+# href of an <a> tag pointing at an IMDb title or name page, matched on
+# the raw HTML so no tree has to be built.
+_IMDB_ANCHOR_HREF_RE = re.compile(
+    r"""<a\b(?:[^>"']|"[^"]*"|'[^']*')*?\shref\s*=\s*["']?[^"'\s>]*?/(title/tt\d+|name/nm\d+)""",
+    re.IGNORECASE,
+)
+_GOOGLE_IMDB_URL_RE = re.compile(r"https?://www\.imdb\.com/(title/tt\d+|name/nm\d+)")
 
 
 def _write_json(path: str, payload: dict) -> None:
+    if orjson is not None:
+        with open(path, "wb") as handle:
+            handle.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w", encoding="utf-8") as handle:
         json.dump(payload, handle, ensure_ascii=True, indent=2)
 
@@ -22,34 +50,18 @@ def _write_json(path: str, payload: dict) -> None:
 def _detect_blocked_page(final_url: Optional[str], html: Optional[str]) -> bool:
     if not final_url or not html:
         return False
-    lowered = html.casefold()
     if "consent.google.com" in final_url:
         return True
-    blocked_markers = [
-        "unusual traffic",
-        "detected unusual traffic",
-        "sorry/index",
-        "recaptcha",
-        "before you continue",
-        "verify you are not a robot",
-        "robot check",
-        "captcha",
-    ]
-    if "google.com" in final_url or "youtube.com" in final_url:
-        return any(marker in lowered for marker in blocked_markers)
-    return False
+    if "google.com" not in final_url and "youtube.com" not in final_url:
+        return False
+    # Only Google/YouTube pages are scanned, so only they pay for the copy.
+    return _BLOCKED_MARKERS_RE.search(html.casefold()) is not None
 
 
 def _extract_imdb_candidate_urls(html: str, limit: int = 5) -> Tuple[str, ...]:
-    soup = BeautifulSoup(html or "", "html.parser")
     urls = []
-    for anchor in soup.find_all("a", href=True):
-        href = anchor.get("href", "")
-        match = re.search(r"/(title/tt\\d+|name/nm\\d+)", href)
-        if not match:
-            continue
-        path = match.group(1)
-        url = f"https://www.imdb.com/{path}/"
+    for match in _IMDB_ANCHOR_HREF_RE.finditer(html or ""):
+        url = f"https://www.imdb.com/{match.group(1)}/"
         if url not in urls:
             urls.append(url)
         if len(urls) >= limit:
@@ -61,7 +73,7 @@ def _extract_google_imdb_urls(html: str, limit: int = 5) -> Tuple[str, ...]:
     urls = []
     if not html:
         return tuple(urls)
-    for match in re.findall(r"https?://www\\.imdb\\.com/(title/tt\\d+|name/nm\\d+)", html):
+    for match in _GOOGLE_IMDB_URL_RE.findall(html):
         url = f"https://www.imdb.com/{match}/"
         if url not in urls:
             urls.append(url)
@@ -70,14 +82,24 @@ def _extract_google_imdb_urls(html: str, limit: int = 5) -> Tuple[str, ...]:
     return tuple(urls)
 
 
-def _fetch_url(page, url: str, timeout_ms: int, retries: int) -> Dict[str, Optional[str]]:
+async def _reset_page(page, timeout_ms: int) -> None:
+    # Pooled pages keep the previous link's document; clear it so a failed
+    # fetch cannot report that URL or screenshot that page as this link's.
+    try:
+        await page.goto("about:blank", timeout=timeout_ms)
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+async def _fetch_url(page, url: str, timeout_ms: int, retries: int) -> Dict[str, Optional[str]]:
     last_error = None
     response = None
+    await _reset_page(page, timeout_ms)
     for _ in range(retries + 1):
         try:
-            response = page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
-            page.wait_for_timeout(250)
-            html = page.content()
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+            await page.wait_for_timeout(250)
+            html = await page.content()
             page_status = "blocked" if _detect_blocked_page(page.url, html) else "ok"
             return {
                 "html": html,
@@ -90,28 +112,30 @@ def _fetch_url(page, url: str, timeout_ms: int, retries: int) -> Dict[str, Optio
             last_error = f"timeout: {exc}"
         except Exception as exc:  # pylint: disable=broad-except
             last_error = f"error: {exc}"
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
     return {
         "html": None,
-        "final_url": page.url if page else None,
+        "final_url": None,
         "status": response.status if response else None,
         "page_status": "error",
         "error": last_error,
     }
 
 
-def _collect_link(page, url: str, meta_path: str, html_path: str, screenshot_path: Optional[str],
-                  timeout_ms: int, retries: int) -> None:
+async def _collect_link(page, url: str, meta_path: str, html_path: str, screenshot_path: Optional[str],
+                        timeout_ms: int, retries: int) -> None:
     if not url:
         return None
-    result = _fetch_url(page, url, timeout_ms=timeout_ms, retries=retries)
+    result = await _fetch_url(page, url, timeout_ms=timeout_ms, retries=retries)
     html = result.pop("html")
     if html is not None:
         with open(html_path, "w", encoding="utf-8") as handle:
             handle.write(html)
+    if html is None:
+        screenshot_path = None
     if screenshot_path:
         try:
-            page.screenshot(path=screenshot_path, full_page=True)
+            await page.screenshot(path=screenshot_path, full_page=True)
         except Exception:
             pass
     meta = {
@@ -128,89 +152,145 @@ def _collect_link(page, url: str, meta_path: str, html_path: str, screenshot_pat
     return {"html": html, "meta": meta}
 
 
+class _PagePool:
+    """Reusable browser pages shared by concurrent task collectors."""
+
+    def __init__(self, pages: List, timeout_ms: int, retries: int,
+                 per_host_concurrency: Optional[int] = None) -> None:
+        self._pages: asyncio.Queue = asyncio.Queue()
+        for page in pages:
+            self._pages.put_nowait(page)
+        # Keyed on the link's own host, before any redirect; shortener links
+        # (tinyurl.com) all share one slot group, so the cap is opt-in.
+        self._host_limits = (
+            defaultdict(lambda: asyncio.Semaphore(per_host_concurrency)) if per_host_concurrency else None
+        )
+        self._timeout_ms = timeout_ms
+        self._retries = retries
+
+    async def collect_link(self, url: str, meta_path: str, html_path: str,
+                           screenshot_path: Optional[str]) -> Optional[dict]:
+        # Take the host slot before a page so waiting on a busy host does not
+        # hold a page other hosts could use.
+        host_limit = self._host_limits[urlsplit(url).netloc] if self._host_limits is not None else nullcontext()
+        async with host_limit:
+            page = await self._pages.get()
+            try:
+                return await _collect_link(
+                    page,
+                    url,
+                    meta_path=meta_path,
+                    html_path=html_path,
+                    screenshot_path=screenshot_path,
+                    timeout_ms=self._timeout_ms,
+                    retries=self._retries,
+                )
+            finally:
+                self._pages.put_nowait(page)
+
+
+async def _collect_task(pool: _PagePool, task: TaskInput, cache_dir: str, screenshot: bool, force: bool,
+                        collect_alternatives: bool) -> None:
+    # Links within a task stay sequential: alternatives depend on the query pages.
+    task_dir = os.path.join(cache_dir, safe_filename(task.task_id))
+    ensure_dir(task_dir)
+    task_path = os.path.join(task_dir, "task.json")
+    if not os.path.exists(task_path):
+        _write_json(task_path, task.model_dump())
+
+    candidate_urls = []
+    result_imdb_url = task.result_links.imdb if task.result_links else None
+
+    for prefix, links in (("query", task.query_links), ("result", task.result_links)):
+        for key, url in links.model_dump().items():
+            if not url:
+                continue
+            cache_key = f"{prefix}_{key}"
+            meta_path = os.path.join(task_dir, f"{cache_key}.json")
+            html_path = os.path.join(task_dir, f"{cache_key}.html")
+            screenshot_path = os.path.join(task_dir, f"{cache_key}.png") if screenshot else None
+
+            if not force and os.path.exists(meta_path):
+                if collect_alternatives and prefix == "query":
+                    if os.path.exists(html_path):
+                        with open(html_path, "r", encoding="utf-8") as handle:
+                            cached_html = handle.read()
+                        if key == "imdb" and cached_html:
+                            candidate_urls = list(_extract_imdb_candidate_urls(cached_html, limit=5))
+                        elif key == "google" and cached_html and not candidate_urls:
+                            candidate_urls = list(_extract_google_imdb_urls(cached_html, limit=5))
+                continue
+
+            result = await pool.collect_link(
+                url,
+                meta_path=meta_path,
+                html_path=html_path,
+                screenshot_path=screenshot_path,
+            )
+            if collect_alternatives and prefix == "query":
+                html = result["html"] if result else None
+                if key == "imdb" and html:
+                    candidate_urls = list(_extract_imdb_candidate_urls(html, limit=5))
+                elif key == "google" and html and not candidate_urls:
+                    candidate_urls = list(_extract_google_imdb_urls(html, limit=5))
+
+    if collect_alternatives and candidate_urls:
+        filtered = []
+        for url in candidate_urls:
+            if result_imdb_url and result_imdb_url.rstrip("/") in url.rstrip("/"):
+                continue
+            if url not in filtered:
+                filtered.append(url)
+        for idx, url in enumerate(filtered[:3], start=1):
+            cache_key = f"alt_imdb_{idx}"
+            meta_path = os.path.join(task_dir, f"{cache_key}.json")
+            html_path = os.path.join(task_dir, f"{cache_key}.html")
+            screenshot_path = os.path.join(task_dir, f"{cache_key}.png") if screenshot else None
+            if not force and os.path.exists(meta_path):
+                continue
+            await pool.collect_link(
+                url,
+                meta_path=meta_path,
+                html_path=html_path,
+                screenshot_path=screenshot_path,
+            )
+
+
+async def _collect_async(tasks: List[TaskInput], cache_dir: str, screenshot: bool, force: bool,
+                         collect_alternatives: bool, timeout_ms: int, retries: int,
+                         user_agent: Optional[str], concurrency: int,
+                         per_host_concurrency: Optional[int]) -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(user_agent=user_agent)
+        # Pages are opened once and reused; opening a page per URL is slow.
+        pages = [await context.new_page() for _ in range(max(1, concurrency))]
+        pool = _PagePool(pages, timeout_ms=timeout_ms, retries=retries,
+                         per_host_concurrency=per_host_concurrency)
+        try:
+            await asyncio.gather(*(
+                _collect_task(pool, task, cache_dir, screenshot, force, collect_alternatives)
+                for task in tasks
+            ))
+        finally:
+            await browser.close()
+
+
 def collect(input_path: str, cache_dir: str, screenshot: bool = False, force: bool = False,
             collect_alternatives: bool = False, timeout_ms: int = DEFAULT_TIMEOUT_MS, retries: int = 2,
-            user_agent: Optional[str] = None) -> None:
-    tasks_raw = read_jsonl(input_path)
+            user_agent: Optional[str] = None, concurrency: int = DEFAULT_CONCURRENCY,
+            per_host_concurrency: Optional[int] = None) -> None:
+    tasks = [TaskInput.model_validate(row) for row in read_jsonl(input_path)]
     ensure_dir(cache_dir)
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(user_agent=user_agent)
-
-        for row in tasks_raw:
-            task = TaskInput.model_validate(row)
-            task_dir = os.path.join(cache_dir, safe_filename(task.task_id))
-            ensure_dir(task_dir)
-            task_path = os.path.join(task_dir, "task.json")
-            if not os.path.exists(task_path):
-                _write_json(task_path, task.model_dump())
-
-            candidate_urls = []
-            result_imdb_url = task.result_links.imdb if task.result_links else None
-
-            for prefix, links in (("query", task.query_links), ("result", task.result_links)):
-                for key, url in links.model_dump().items():
-                    if not url:
-                        continue
-                    cache_key = f"{prefix}_{key}"
-                    meta_path = os.path.join(task_dir, f"{cache_key}.json")
-                    html_path = os.path.join(task_dir, f"{cache_key}.html")
-                    screenshot_path = os.path.join(task_dir, f"{cache_key}.png") if screenshot else None
-
-                    if not force and os.path.exists(meta_path):
-                        if collect_alternatives and prefix == "query":
-                            if os.path.exists(html_path):
-                                with open(html_path, "r", encoding="utf-8") as handle:
-                                    cached_html = handle.read()
-                                if key == "imdb" and cached_html:
-                                    candidate_urls = list(_extract_imdb_candidate_urls(cached_html, limit=5))
-                                elif key == "google" and cached_html and not candidate_urls:
-                                    candidate_urls = list(_extract_google_imdb_urls(cached_html, limit=5))
-                        continue
-
-                    page = context.new_page()
-                    result = _collect_link(
-                        page,
-                        url,
-                        meta_path=meta_path,
-                        html_path=html_path,
-                        screenshot_path=screenshot_path,
-                        timeout_ms=timeout_ms,
-                        retries=retries,
-                    )
-                    page.close()
-                    if collect_alternatives and prefix == "query":
-                        html = result["html"] if result else None
-                        if key == "imdb" and html:
-                            candidate_urls = list(_extract_imdb_candidate_urls(html, limit=5))
-                        elif key == "google" and html and not candidate_urls:
-                            candidate_urls = list(_extract_google_imdb_urls(html, limit=5))
-
-            if collect_alternatives and candidate_urls:
-                filtered = []
-                for url in candidate_urls:
-                    if result_imdb_url and result_imdb_url.rstrip("/") in url.rstrip("/"):
-                        continue
-                    if url not in filtered:
-                        filtered.append(url)
-                for idx, url in enumerate(filtered[:3], start=1):
-                    cache_key = f"alt_imdb_{idx}"
-                    meta_path = os.path.join(task_dir, f"{cache_key}.json")
-                    html_path = os.path.join(task_dir, f"{cache_key}.html")
-                    screenshot_path = os.path.join(task_dir, f"{cache_key}.png") if screenshot else None
-                    if not force and os.path.exists(meta_path):
-                        continue
-                    page = context.new_page()
-                    _collect_link(
-                        page,
-                        url,
-                        meta_path=meta_path,
-                        html_path=html_path,
-                        screenshot_path=screenshot_path,
-                        timeout_ms=timeout_ms,
-                        retries=retries,
-                    )
-                    page.close()
-
-        browser.close()
+    asyncio.run(_collect_async(
+        tasks,
+        cache_dir,
+        screenshot=screenshot,
+        force=force,
+        collect_alternatives=collect_alternatives,
+        timeout_ms=timeout_ms,
+        retries=retries,
+        user_agent=user_agent,
+        concurrency=concurrency,
+        per_host_concurrency=per_host_concurrency,
+    ))
@@ -1,54 +1,68 @@
 import copy
+import csv
+import io
 import os
-from collections import Counter, defaultdict
+import sys
+from collections import Counter
+from itertools import product, repeat
 from typing import Dict, List, Optional, Tuple
 
-from .extract import extract_task
+from pydantic import TypeAdapter, ValidationError
+
+from .extract import _extract_many
 from .schemas import Features, LabeledFeature
-from .score import LABELS, score_features
-from .utils import dump_yaml, load_yaml, read_jsonl, safe_filename
+from .score import LABELS, _gate_output, _prepare_config, _score_ungated, detect_mode, score_features
+from .utils import dump_yaml, load_yaml_cached, read_jsonl, safe_filename
+
+
+_LABELED_ADAPTER = TypeAdapter(List[LabeledFeature])
 
 
-def _load_labeled(path: str) -> List[LabeledFeature]:
+def load_labeled(path: str) -> List[LabeledFeature]:
     rows = read_jsonl(path)
-    labeled = []
-    for row in rows:
-        entry = LabeledFeature.model_validate(row)
-        labeled.append(entry)
-    return labeled
+    try:
+        return _LABELED_ADAPTER.validate_python(rows)
+    except ValidationError:
+        # Re-validate row by row so the error names the offending row.
+        return [LabeledFeature.model_validate(row) for row in rows]
 
 
 def _label_of(entry: LabeledFeature) -> str:
-    return entry.label or entry.rating or ""
+    # Gold labels come from a small closed set; interning lets the metric
+    # loops compare and hash one shared object per label.
+    return sys.intern(entry.label or entry.rating or "")
 
 
-def _compute_metrics(preds: List[str], labels: List[str]) -> Dict[str, object]:
+def compute_metrics(preds: List[str], labels: List[str]) -> Dict[str, object]:
     total = len(labels)
     correct = sum(1 for p, l in zip(preds, labels) if p == l)
     accuracy = correct / total if total else 0.0
 
     labels_set = sorted(set(labels) | set(preds) | set(LABELS))
-    counts = Counter(labels)
-    for label in labels_set:
-        counts.setdefault(label, 0)
-    confusion = {label: Counter() for label in labels_set}
-    for pred, label in zip(preds, labels):
-        confusion[label][pred] += 1
-    for label in labels_set:
-        for pred_label in labels_set:
-            confusion[label].setdefault(pred_label, 0)
+    index = {label: i for i, label in enumerate(labels_set)}
+    size = len(labels_set)
+    # Dense confusion matrix indexed [true][pred].
+    matrix = [[0] * size for _ in range(size)]
+    for (label, pred), count in Counter(zip(labels, preds)).items():
+        matrix[index[label]][index[pred]] = count
+    # Per-label support and prediction totals, counted in O(N) rather than
+    # summed across the L x L matrix.
+    label_counts = Counter(labels)
+    pred_counts = Counter(preds)
+    row_totals = [label_counts[label] for label in labels_set]
+    col_totals = [pred_counts[label] for label in labels_set]
 
     f1_scores = []
     f1_support_scores = []
-    for label in labels_set:
-        tp = confusion[label][label]
-        fp = sum(confusion[other].get(label, 0) for other in labels_set if other != label)
-        fn = sum(confusion[label].get(other, 0) for other in labels_set if other != label)
+    for i in range(size):
+        tp = matrix[i][i]
+        fp = col_totals[i] - tp
+        fn = row_totals[i] - tp
         precision = tp / (tp + fp) if (tp + fp) else 0.0
         recall = tp / (tp + fn) if (tp + fn) else 0.0
         f1 = (2 * precision * recall / (precision + recall)) if (precision + recall) else 0.0
         f1_scores.append(f1)
-        if counts.get(label, 0) > 0:
+        if row_totals[i] > 0:
             f1_support_scores.append(f1)
     macro_f1 = sum(f1_scores) / len(f1_scores) if f1_scores else 0.0
     macro_f1_support_only = (
@@ -62,53 +76,53 @@ def _compute_metrics(preds: List[str], labels: List[str]) -> Dict[str, object]:
         "macro_f1": macro_f1,
         "macro_f1_all_labels": macro_f1,
         "macro_f1_support_only": macro_f1_support_only,
-        "counts": dict(counts),
-        "confusion": {k: dict(v) for k, v in confusion.items()},
+        "counts": dict(zip(labels_set, row_totals)),
+        "confusion": {label: dict(zip(labels_set, matrix[i])) for i, label in enumerate(labels_set)},
     }
 
 
-def _format_metrics(metrics: Dict[str, object]) -> str:
+def format_metrics(metrics: Dict[str, object]) -> str:
     lines = []
     lines.append(f"Accuracy: {metrics['accuracy']:.3f} ({metrics['correct']}/{metrics['total']})")
     lines.append(f"Macro-F1: {metrics['macro_f1']:.3f}")
     lines.append(f"Macro-F1 (support-only): {metrics['macro_f1_support_only']:.3f}")
+    label_counts = sorted(metrics["counts"].items())
     lines.append("Label counts:")
-    for label, count in sorted(metrics["counts"].items()):
+    for label, count in label_counts:
         lines.append(f"  {label}: {count}")
     lines.append("Confusion matrix:")
-    labels = sorted(metrics["counts"].keys())
-    header = "true\\pred," + ",".join(labels)
-    lines.append(header)
-    for label in labels:
-        row = [label]
-        for pred in labels:
-            row.append(str(metrics["confusion"].get(label, {}).get(pred, 0)))
-        lines.append(",".join(row))
+    labels = [label for label, _ in label_counts]
+    confusion = metrics["confusion"]
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(["true\\pred", *labels])
+    writer.writerows(
+        [label, *map(confusion.get(label, {}).get, labels, repeat(0))] for label in labels
+    )
+    lines.append(buf.getvalue().rstrip("\n"))
     return "\n".join(lines)
 
 
-def _features_from_labeled(labeled: List[LabeledFeature], cache_dir: Optional[str]) -> Tuple[List[Features], List[str]]:
-    features_list = []
-    labels = []
-    for entry in labeled:
-        label = _label_of(entry)
-        labels.append(label)
-        if entry.features:
-            features_list.append(entry.features)
-            continue
-        if not cache_dir:
-            raise ValueError("cache_dir is required when labeled entries do not include features")
-        task_dir = os.path.join(cache_dir, safe_filename(entry.task_id))
-        features = extract_task(task_dir)
+def features_from_labeled(labeled: List[LabeledFeature], cache_dir: Optional[str]) -> Tuple[List[Features], List[str]]:
+    labels = [_label_of(entry) for entry in labeled]
+    features_list = [entry.features for entry in labeled]
+    missing = [idx for idx, features in enumerate(features_list) if not features]
+    if not missing:
+        return features_list, labels
+    if not cache_dir:
+        raise ValueError("cache_dir is required when labeled entries do not include features")
+
+    task_dirs = [os.path.join(cache_dir, safe_filename(labeled[idx].task_id)) for idx in missing]
+    for idx, features in zip(missing, _extract_many(task_dirs)):
         if not features:
-            raise ValueError(f"missing cached features for task_id={entry.task_id}")
-        features_list.append(features)
+            raise ValueError(f"missing cached features for task_id={labeled[idx].task_id}")
+        features_list[idx] = features
     return features_list, labels
 
 
 def fit_thresholds(train_path: str, config_in: str, config_out: str,
                    cache_dir: Optional[str] = None) -> Tuple[Dict[str, object], str]:
-    config = load_yaml(config_in)
+    config = load_yaml_cached(config_in)
     grid = config.get("fit", {}).get("grid", {})
 
     thresholds_grid = grid.get("thresholds", {})
@@ -127,53 +141,83 @@ def fit_thresholds(train_path: str, config_in: str, config_out: str,
     popularity_grid = weights_grid.get("popularity", [config.get("weights", {}).get("popularity", 0.3)])
     dominance_weight_grid = weights_grid.get("dominance", [config.get("weights", {}).get("dominance", 0.2)])
 
-    labeled = _load_labeled(train_path)
-    features_list, labels = _features_from_labeled(labeled, cache_dir)
-
-    best = {"accuracy": -1.0, "config": None}
-
-    for perfect in perfect_grid:
-        for good in good_grid:
-            for acceptable in acceptable_grid:
-                if not (perfect >= good >= acceptable):
-                    continue
-                for dom_perfect in dom_perfect_grid:
-                    for dom_good in dom_good_grid:
-                        for dom_acceptable in dom_acceptable_grid:
-                            if not (dom_perfect >= dom_good >= dom_acceptable):
-                                continue
-                            for match in match_grid:
-                                for popularity in popularity_grid:
-                                    for dominance in dominance_weight_grid:
-                                        if abs((match + popularity + dominance) - 1.0) > 0.05:
-                                            continue
-                                        trial_config = copy.deepcopy(config)
-                                        trial_config["thresholds"] = {
-                                            "perfect": float(perfect),
-                                            "good": float(good),
-                                            "acceptable": float(acceptable),
-                                        }
-                                        trial_config["dominance_cutoffs"] = {
-                                            "perfect": float(dom_perfect),
-                                            "good": float(dom_good),
-                                            "acceptable": float(dom_acceptable),
-                                        }
-                                        trial_config["weights"] = {
-                                            "match": float(match),
-                                            "popularity": float(popularity),
-                                            "dominance": float(dominance),
-                                        }
-                                        preds = [score_features(f, trial_config).rating for f in features_list]
-                                        metrics = _compute_metrics(preds, labels)
-                                        if metrics["accuracy"] > best["accuracy"]:
-                                            best = {"accuracy": metrics["accuracy"], "config": trial_config}
+    labeled = load_labeled(train_path)
+    features_list, labels = features_from_labeled(labeled, cache_dir)
+
+    # Each grid axis is filtered once, up front, instead of re-checking the
+    # constraints inside a nine-deep loop.
+    threshold_triples = [
+        cutoffs for cutoffs in product(perfect_grid, good_grid, acceptable_grid)
+        if cutoffs[0] >= cutoffs[1] >= cutoffs[2]
+    ]
+    dominance_triples = [
+        cutoffs for cutoffs in product(dom_perfect_grid, dom_good_grid, dom_acceptable_grid)
+        if cutoffs[0] >= cutoffs[1] >= cutoffs[2]
+    ]
+    weight_triples = [
+        weights for weights in product(match_grid, popularity_grid, dominance_weight_grid)
+        if abs(sum(weights) - 1.0) <= 0.05
+    ]
+
+    # Gate outcomes do not depend on the grid parameters, so gated rows are
+    # scored once here and only the rest are re-scored per trial, skipping
+    # the gates they are already known to pass.
+    fixed_correct = 0
+    open_rows = []
+    for features, label in zip(features_list, labels):
+        mode = detect_mode(features.query)
+        gated, incomplete_title = _gate_output(features, config, mode)
+        if gated is None:
+            open_rows.append((features, label, mode, incomplete_title))
+        elif gated.rating == label:
+            fixed_correct += 1
+
+    # Trials are ranked by correct count; the label count is fixed, so this
+    # orders them exactly as accuracy does without building full metrics.
+    best_correct = -1
+    best_config = None
+    for (perfect, good, acceptable), (dom_perfect, dom_good, dom_acceptable), (match, popularity, dominance) in product(
+        threshold_triples, dominance_triples, weight_triples
+    ):
+        # Shallow: score_features only reads the config, and the three
+        # replaced sections are fresh dicts per trial.
+        trial_config = {
+            **config,
+            "thresholds": {
+                "perfect": float(perfect),
+                "good": float(good),
+                "acceptable": float(acceptable),
+            },
+            "dominance_cutoffs": {
+                "perfect": float(dom_perfect),
+                "good": float(dom_good),
+                "acceptable": float(dom_acceptable),
+            },
+            "weights": {
+                "match": float(match),
+                "popularity": float(popularity),
+                "dominance": float(dominance),
+            },
+        }
+        scoring, rules = _prepare_config(trial_config)
+        correct = fixed_correct + sum(
+            _score_ungated(f, trial_config, mode, incomplete_title, scoring, rules).rating == label
+            for f, label, mode, incomplete_title in open_rows
+        )
+        if correct > best_correct:
+            best_correct, best_config = correct, trial_config
+    best = {
+        "accuracy": best_correct / len(labels) if labels else 0.0,
+        "config": best_config,
+    }
 
     if best["config"]:
-        config = best["config"]
+        # Copied once so recording fit stats below cannot touch the input config.
+        config = copy.deepcopy(best["config"])
         config["fit"] = config.get("fit", {})
         config["fit"]["last_accuracy"] = best["accuracy"]
 
     preds = [score_features(f, config).rating for f in features_list]
-    metrics = _compute_metrics(preds, labels)
+    metrics = compute_metrics(preds, labels)
     dump_yaml(config_out, config)
-    return config, _format_metrics(metrics)
+    return config, format_metrics(metrics)
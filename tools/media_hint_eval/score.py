@@ -2,9 +2,13 @@ import difflib
 import math
 import re
 import unicodedata
-from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from .schemas import Features, ScoreOutput
+from .schemas import Features, ScoreDebug, ScoreOutput
 
 
 LABELS = [
@@ -18,23 +22,117 @@ LABELS = [
     "Problem: Other",
 ]
 
-
+_WORD_RE = re.compile(r"[A-Za-z0-9']+")
+_LOWER_WORD_RE = re.compile(r"[a-z0-9]+")
+_VOWEL_RE = re.compile(r"[aeiou]", re.IGNORECASE)
+# Every byte except a-z and 0-9; non-ASCII is dropped by the encode step.
+_NON_ALNUM_ASCII = bytes(b for b in range(128) if not (0x61 <= b <= 0x7A or 0x30 <= b <= 0x39))
+_LATIN_WORD_RE = re.compile(r"[A-Za-zÀ-ÿ']+")
+_UNICODE_WORD_RE = re.compile(r"\w+")
+
+_HIRAGANA_RE = re.compile(r'[\u3040-\u309F]')
+_KATAKANA_RE = re.compile(r'[\u30A0-\u30FF]')
+# CJK Unified Ideographs (common kanji range)
+_KANJI_RE = re.compile(r'[\u4E00-\u9FFF]')
+_ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
+_ARABIC_DIGIT_RE = re.compile(r'[0-9]')
+_KANJI_NUMBER_RE = re.compile(r'[一二三四五六七八九十百千万億]')
+
+def _alternation(*patterns: str) -> re.Pattern:
+    # One search over the combined pattern replaces a search per pattern.
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+# Sentence-like (contains common filler words in sentence positions)
+_SENTENCE_RE = _alternation(
+    r"^(any|some|the best|a good|find|show me|looking for)\b",
+    r"\b(that|which|featuring|with|about|on)\b.*\b(movies?|films?|shows?|series)\b",
+    r"\bmovies?\s+that\b",
+    r"\bfilms?\s+that\b",
+    r"\bcontent\s+on\b",
+)
+
+# Subtitle separators checked by _detect_incomplete_title, in priority order.
+_TITLE_SEPARATORS = (":", "-", "–", "—")
+_TITLE_SEPARATOR_RE = re.compile(r"[:\-–—]")
+
+# Sequel numbering: 2-4, ii-iv or "part 2".."part 4" as whole words.
+_SEQUEL_RE = re.compile(r"\b(?:[234]|ii|iii|iv|part\s+[234])\b", re.IGNORECASE)
+
+# Multiple modifier indicators
+_COMPLEXITY_RE = _alternation(
+    r"\b(with|featuring|about|starring)\b.*\b(and|or|that)\b",  # chained conditions
+    r"\bthat\s+are\b.*\band\b",  # "that are X and Y"
+    r"\b(both|also|as well as)\b",  # explicit multi-aspect
+    r"\b(from\s+the|in\s+the)\b.*\b(with|featuring|about)\b",  # era + condition
+    r"(movies?|films?|shows?)\s+that\s+\w+\s+and\s+\w+",  # "movies that X and Y"
+)
+
+# Category/genre phrases that mark a result as a category rather than a title
+_CATEGORY_RE = _alternation(
+    r"\banimation\b",
+    r"\banimated\b",
+    r"\baction\s+movies?\b",
+    r"\bcomedy\s+movies?\b",
+    r"\bhorror\s+movies?\b",
+    r"\bdrama\s+movies?\b",
+    r"\bdisney\+?\b.*\b(movies?|shows?|series|animation)\b",
+    r"\bnetflix\b.*\b(movies?|shows?|series|originals?)\b",
+    r"\bmovies?\s+(that|with|featuring|about)\b",
+    r"\bfilms?\s+(that|with|featuring|about)\b",
+    r"\bsuperheroes?\b",
+    r"\baction\b.*\bsuperheroes?\b",
+)
+
+
+@lru_cache(maxsize=4096)
 def detect_mode(query: str) -> str:
     text = (query or "").strip()
-    tokens = re.findall(r"[A-Za-z0-9']+", text)
+    tokens = _WORD_RE.findall(text)
     if len(text) <= 3 or len(tokens) <= 1:
         return "prefix"
     if tokens:
         last = tokens[-1]
-        has_vowel = re.search(r"[aeiou]", last, re.IGNORECASE) is not None
+        has_vowel = _VOWEL_RE.search(last) is not None
         if len(last) <= 2 or (len(last) <= 4 and not has_vowel):
             return "prefix"
     return "intent"
 
 
+def _build_latin_diacritics_lut() -> Dict[int, str]:
+    # Per-codepoint NFKD minus combining marks. Decomposition is per codepoint
+    # and canonical reordering only moves the marks being dropped, so applying
+    # this with str.translate matches the full algorithm in _strip_diacritics.
+    lut = {}
+    for code in range(0x80, ord(_LATIN_LUT_MAX) + 1):
+        char = chr(code)
+        stripped = "".join(
+            ch for ch in unicodedata.normalize("NFKD", char) if not unicodedata.combining(ch)
+        )
+        if stripped != char:
+            lut[code] = stripped
+    return lut
+
+
+# Latin-1 Supplement through Latin Extended-B covers most accented titles.
+_LATIN_LUT_MAX = "\u024f"
+_LATIN_DIACRITICS_LUT = _build_latin_diacritics_lut()
+
+
+# The string helpers below are pure and see the same titles several times
+# per scoring call (and again across rows), so they are memoized.
+@lru_cache(maxsize=4096)
 def _strip_diacritics(value: str) -> str:
+    # ASCII is already NFKD and has no combining marks.
+    if value.isascii():
+        return value
+    if max(value) <= _LATIN_LUT_MAX:
+        return value.translate(_LATIN_DIACRITICS_LUT)
     normalized = unicodedata.normalize("NFKD", value)
-    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    # A list comprehension with a local alias beats both a generator and
+    # str.translate with a combining-mark table on mixed-script titles.
+    combining = unicodedata.combining
+    return "".join([ch for ch in normalized if not combining(ch)])
 
 
 # Japan-specific writing system detection (JP01-JP06)
@@ -54,13 +152,12 @@ def _detect_writing_system(text: str) -> dict:
         return {"hiragana": 0, "katakana": 0, "kanji": 0, "ascii": 0,
                 "numbers_arabic": 0, "numbers_kanji": 0}
 
-    hiragana = len(re.findall(r'[\u3040-\u309F]', text))
-    katakana = len(re.findall(r'[\u30A0-\u30FF]', text))
-    # CJK Unified Ideographs (common kanji range)
-    kanji = len(re.findall(r'[\u4E00-\u9FFF]', text))
-    ascii_chars = len(re.findall(r'[A-Za-z]', text))
-    numbers_arabic = len(re.findall(r'[0-9]', text))
-    numbers_kanji = len(re.findall(r'[一二三四五六七八九十百千万億]', text))
+    hiragana = len(_HIRAGANA_RE.findall(text))
+    katakana = len(_KATAKANA_RE.findall(text))
+    kanji = len(_KANJI_RE.findall(text))
+    ascii_chars = len(_ASCII_LETTER_RE.findall(text))
+    numbers_arabic = len(_ARABIC_DIGIT_RE.findall(text))
+    numbers_kanji = len(_KANJI_NUMBER_RE.findall(text))
 
     return {
         "hiragana": hiragana,
@@ -145,28 +242,39 @@ def _detect_jp_number_format_mismatch(result: str, official: Optional[str]) -> b
     return False
 
 
+@lru_cache(maxsize=4096)
 def _normalize_basic(value: str) -> str:
-    return re.sub(r"\s+", " ", value.strip().casefold())
+    # str.split() and \s agree on what whitespace is; both collapse runs.
+    return " ".join(value.strip().casefold().split())
 
 
+@lru_cache(maxsize=4096)
 def _normalize_punct(value: str) -> str:
-    value = _strip_diacritics(value.casefold())
-    value = re.sub(r"[^a-z0-9]+", "", value)
-    return value
+    if value.isascii():
+        value = value.lower()  # casefold() == lower() on ASCII
+    else:
+        value = _strip_diacritics(value.casefold())
+    # Keeps only [a-z0-9], like re.sub(r"[^a-z0-9]+", "", value), in C.
+    return value.encode("ascii", "ignore").translate(None, _NON_ALNUM_ASCII).decode("ascii")
 
 
-def _detect_incomplete_title(official: str, result: str) -> bool:
+def _detect_incomplete_title(official: str, result: str, result_norm: Optional[str] = None) -> bool:
     if not official or not result:
         return False
-    separators = [":", "-", "–", "—"]
-    for sep in separators:
-        if sep in official:
-            prefix = official.split(sep, 1)[0].strip()
-            if _normalize_punct(prefix) == _normalize_punct(result):
-                return True
+    # One scan rejects the common no-separator title; otherwise each separator
+    # still gets its own prefix, since they can yield different splits.
+    if not _TITLE_SEPARATOR_RE.search(official):
+        return False
+    if result_norm is None:
+        result_norm = _normalize_punct(result)
+    for sep in _TITLE_SEPARATORS:
+        idx = official.find(sep)
+        if idx != -1 and _normalize_punct(official[:idx].strip()) == result_norm:
+            return True
     return False
 
 
+@lru_cache(maxsize=4096)
 def _is_non_title_format(text: str) -> bool:
     """Detect conversational/question format that isn't a valid title."""
     if not text:
@@ -178,29 +286,25 @@ def _is_non_title_format(text: str) -> bool:
     # Conversational filler
     if lower.startswith("any "):
         return True
-    # Sentence-like (contains common filler words in sentence positions)
-    sentence_patterns = [
-        r"^(any|some|the best|a good|find|show me|looking for)\b",
-        r"\b(that|which|featuring|with|about|on)\b.*\b(movies?|films?|shows?|series)\b",
-        r"\bmovies?\s+that\b",
-        r"\bfilms?\s+that\b",
-        r"\bcontent\s+on\b",
-    ]
-    for pattern in sentence_patterns:
-        if re.search(pattern, lower):
-            return True
-    return False
+    return _SENTENCE_RE.search(lower) is not None
 
 
-def _detect_diacritics_mismatch(result: str, official: str) -> bool:
+def _detect_diacritics_mismatch(result: str, official: str,
+                                result_norm: Optional[str] = None,
+                                official_norm: Optional[str] = None) -> bool:
     """Detect if result matches official but is missing diacritics."""
     if not result or not official:
         return False
+    # Both checks below need a diacritic in the official title; ASCII has none.
+    if official.isascii():
+        return False
 
-    result_norm = _normalize_punct(result)
+    if result_norm is None:
+        result_norm = _normalize_punct(result)
 
     # Check full title match (stripped diacritics match but original doesn't)
-    official_norm = _normalize_punct(official)
+    if official_norm is None:
+        official_norm = _normalize_punct(official)
     if result_norm == official_norm:
         # They match when normalized, check if original has diacritics
         if _strip_diacritics(official) != official:
@@ -208,12 +312,12 @@ def _detect_diacritics_mismatch(result: str, official: str) -> bool:
 
     # Check if result matches a word in official title
     # e.g., "amelie" matches "Amélie" from "Le fabuleux destin d'Amélie Poulain"
-    words = re.findall(r"[A-Za-zÀ-ÿ']+", official)
+    words = _LATIN_WORD_RE.findall(official)
     for word in words:
         word_norm = _normalize_punct(word)
         if word_norm and word_norm == result_norm:
             # Check if the original word has diacritics
-            if _strip_diacritics(word) != word:
+            if not word.isascii() and _strip_diacritics(word) != word:
                 return True
 
     return False
@@ -230,16 +334,21 @@ def _detect_spelling_gate(result: str, official: Optional[str], is_category: boo
         return False, False, False, False
 
     result_clean = result.strip()
-    lower = result_clean.casefold()
-    conversational = lower.startswith("any ") or lower.endswith("?")
-    non_title_format = _is_non_title_format(result_clean)
 
     # Category results are NOT spelling errors even if they look like non-title format
     if is_category:
-        non_title_format = False
-        conversational = False
+        conversational = non_title_format = False
+    else:
+        lower = result_clean.casefold()
+        conversational = lower.startswith("any ") or lower.endswith("?")
+        # _is_non_title_format starts with the same two checks.
+        non_title_format = conversational or _is_non_title_format(result_clean)
 
-    incomplete_title = _detect_incomplete_title(official, result_clean)
+    # Normalized once and shared by the incomplete/diacritics/punctuation checks.
+    result_norm = _normalize_punct(result_clean)
+    official_norm = _normalize_punct(official)
+
+    incomplete_title = _detect_incomplete_title(official, result_clean, result_norm)
     if incomplete_title:
         return False, True, conversational, non_title_format
 
@@ -247,26 +356,51 @@ def _detect_spelling_gate(result: str, official: Optional[str], is_category: boo
         return False, False, conversational, non_title_format
 
     # Check for diacritics mismatch
-    diacritics_mismatch = _detect_diacritics_mismatch(result_clean, official)
+    diacritics_mismatch = _detect_diacritics_mismatch(result_clean, official, result_norm, official_norm)
     if diacritics_mismatch:
         return True, False, conversational, non_title_format
 
     # Check punctuation-only difference
-    missing_punct = _normalize_punct(result_clean) == _normalize_punct(official)
+    missing_punct = result_norm == official_norm
     return missing_punct or conversational or non_title_format, False, conversational, non_title_format
 
 
+@lru_cache(maxsize=32)
+def _concerns_pattern(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    if not keywords:
+        return None
+    # One alternation scans each text once for every keyword.
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
 def _detect_concerns(texts: Tuple[str, ...], keywords) -> bool:
+    pattern = _concerns_pattern(tuple(keywords))
+    if pattern is None:
+        return False
     for text in texts:
-        if not text:
-            continue
-        lowered = text.casefold()
-        for keyword in keywords:
-            if keyword in lowered:
-                return True
+        if text and pattern.search(text.casefold()):
+            return True
     return False
 
 
+@lru_cache(maxsize=4096)
+def _sequence_ratio(left: str, right: str) -> float:
+    # Identical strings (the common "result == official" case) skip the matcher.
+    if left == right:
+        return 1.0 if left else 0.0
+    return difflib.SequenceMatcher(a=left, b=right).ratio()
+
+
+def _ratio_at_least(left: str, right: str, cutoff: float) -> bool:
+    # ratio() is 2*M/T with at most min(len) matched characters, so the
+    # length bound alone rules out pairs that cannot reach the cutoff without
+    # building a matcher.
+    if left != right and 2.0 * min(len(left), len(right)) / (len(left) + len(right)) < cutoff:
+        return False
+    return _sequence_ratio(left, right) >= cutoff
+
+
+@lru_cache(maxsize=4096)
 def _compute_match_strength(result: str, official: Optional[str]) -> float:
     if not result or not official:
         return 0.0
@@ -274,7 +408,7 @@ def _compute_match_strength(result: str, official: Optional[str]) -> float:
     right = _normalize_punct(official)
     if not left or not right:
         return 0.0
-    return difflib.SequenceMatcher(a=left, b=right).ratio()
+    return _sequence_ratio(left, right)
 
 
 def _compute_prefix_match_strength(query: str, result: str, official: Optional[str]) -> tuple:
@@ -294,31 +428,24 @@ def _compute_prefix_match_strength(query: str, result: str, official: Optional[s
     result_norm = _normalize_punct(result)
     official_norm = _normalize_punct(official) if official else ""
 
-    # Extract words from original strings (before punct removal) for word-level matching
-    result_words = [_normalize_punct(w) for w in re.findall(r"[A-Za-z0-9']+", result)]
-    official_words = [_normalize_punct(w) for w in re.findall(r"[A-Za-z0-9']+", official)] if official else []
-
-    # Check if query matches first word (strong prefix match candidate)
-    first_word_match = False
-    if result_norm.startswith(query_norm):
-        first_word_match = True
-    elif result_words and result_words[0].startswith(query_norm):
-        first_word_match = True
+    # Check if query matches first word (strong prefix match candidate).
+    # Word lists (from the original strings, before punct removal) are only
+    # built when the whole-result check fails.
+    first_word_match = result_norm.startswith(query_norm)
 
     # Check if query matches a secondary word (weak/poorly related match)
     secondary_word_match = False
     if not first_word_match:
-        # Check result words
-        for word in result_words[1:]:  # Skip first word
-            if word.startswith(query_norm):
-                secondary_word_match = True
-                break
-        # Check official title words
-        if not secondary_word_match:
-            for word in official_words[1:]:  # Skip first word
-                if word.startswith(query_norm):
-                    secondary_word_match = True
-                    break
+        result_words = [_normalize_punct(w) for w in _WORD_RE.findall(result)]
+        first_word_match = bool(result_words) and result_words[0].startswith(query_norm)
+    if not first_word_match:
+        official_words = [_normalize_punct(w) for w in _WORD_RE.findall(official)] if official else []
+        # Non-first result and official title words, each preceded by a
+        # separator that normalized words cannot contain, so a single
+        # substring search finds any word starting with the query.
+        # (query_norm is non-empty here: "" would have matched the first word.)
+        words = "\x1f" + "\x1f".join(chain(result_words[1:], official_words[1:]))
+        secondary_word_match = ("\x1f" + query_norm) in words
 
     # If no match at all, irrelevant
     if not first_word_match and not secondary_word_match:
@@ -335,48 +462,111 @@ def _compute_prefix_match_strength(query: str, result: str, official: Optional[s
         result_matches_official = result_norm == official_norm or result_norm in official_norm
 
         # Also check first word of official
-        if official_words and official_words[0].startswith(query_norm):
-            official_starts = True
+        if not official_starts:
+            first_official = _WORD_RE.search(official)
+            if first_official and _normalize_punct(first_official.group()).startswith(query_norm):
+                official_starts = True
 
         if official_starts and result_matches_official:
             return (2, False)
 
         # Check similarity
-        similarity = difflib.SequenceMatcher(a=result_norm, b=official_norm).ratio()
-        if similarity >= 0.8:
+        if _ratio_at_least(result_norm, official_norm, 0.8):
             return (2, False)
 
     # Default to related match (first word partial match)
     return (1, False)
 
 
+@dataclass(frozen=True)
+class _ScoringConfig:
+    """Numeric weights read from a config dict once per score_features call."""
+
+    match_weight: float
+    popularity_weight: float
+    dominance_weight: float
+    rating_weight: float
+    votes_weight: float
+    category_score: float
+    starmeter_max: float
+    log10_max_votes: float
+    sequel_penalty: float
+
+    @classmethod
+    def from_config(cls, config: dict) -> "_ScoringConfig":
+        weights = config.get("weights", {})
+        pop_cfg = config.get("popularity", {})
+        return cls(
+            match_weight=float(weights.get("match", 0.5)),
+            popularity_weight=float(weights.get("popularity", 0.3)),
+            dominance_weight=float(weights.get("dominance", 0.2)),
+            rating_weight=float(pop_cfg.get("rating_weight", 0.4)),
+            votes_weight=float(pop_cfg.get("votes_weight", 0.6)),
+            category_score=float(pop_cfg.get("category_score", 0.35)),
+            starmeter_max=float(pop_cfg.get("starmeter_max", 500000)),
+            log10_max_votes=math.log10(float(pop_cfg.get("max_votes", 1000000))),
+            sequel_penalty=float(config.get("sequel_penalty", 0.0)),
+        )
+
+
+@dataclass(frozen=True)
+class _RuleConfig:
+    """Rule cutoffs score_features applies after the component score."""
+
+    alt_margin: float
+    alt_min_popularity: float
+    niche_popularity: float
+    irrelevant_match: float
+    weak_prefix_max_len: int
+    weak_prefix_match_min: float
+    weak_prefix_popularity_min: float
+    unpopular_match_min: float
+    unpopular_votes_max: Optional[int]
+
+    @classmethod
+    def from_config(cls, config: dict) -> "_RuleConfig":
+        weak_prefix_cfg = config.get("weak_prefix", {})
+        unpopular_cfg = config.get("unpopular_acceptance", {})
+        votes_max = unpopular_cfg.get("votes_max", 5000)
+        return cls(
+            alt_margin=float(config.get("alt_margin", 0.2)),
+            alt_min_popularity=float(config.get("alt_min_popularity", 0.05)),
+            niche_popularity=float(config.get("niche_popularity", 0.2)),
+            irrelevant_match=float(config.get("irrelevant_match_max", 0.6)),
+            weak_prefix_max_len=int(weak_prefix_cfg.get("max_len", 2)),
+            weak_prefix_match_min=float(weak_prefix_cfg.get("match_min", 0.8)),
+            weak_prefix_popularity_min=float(weak_prefix_cfg.get("popularity_min", 0.2)),
+            unpopular_match_min=float(unpopular_cfg.get("match_min", 0.9)),
+            unpopular_votes_max=int(votes_max) if votes_max is not None else None,
+        )
+
+
+def _prepare_config(config: dict) -> Tuple[_ScoringConfig, _RuleConfig]:
+    return _ScoringConfig.from_config(config), _RuleConfig.from_config(config)
+
+
+# _ScoringConfig is frozen (hashable), and the same alternatives recur across
+# rows of a batch, so entries are memoized like the string helpers above.
+@lru_cache(maxsize=4096)
 def _compute_popularity_entry(content_type: str, imdb_votes: Optional[int],
                               imdb_rating: Optional[float], starmeter: Optional[int],
-                              config: dict) -> float:
-    pop_cfg = config.get("popularity", {})
-    max_votes = float(pop_cfg.get("max_votes", 1000000))
-    rating_weight = float(pop_cfg.get("rating_weight", 0.4))
-    votes_weight = float(pop_cfg.get("votes_weight", 0.6))
-    category_score = float(pop_cfg.get("category_score", 0.35))
-
+                              scoring: _ScoringConfig) -> float:
     if content_type == "person":
-        starmeter_max = float(pop_cfg.get("starmeter_max", 500000))
         if starmeter is None:
             return 0.0
-        rank = float(starmeter)
-        return max(0.0, 1.0 - min(rank, starmeter_max) / starmeter_max)
+        starmeter_max = scoring.starmeter_max
+        return max(0.0, 1.0 - min(float(starmeter), starmeter_max) / starmeter_max)
     if content_type == "category":
-        return category_score
-
-    rating_score = 0.0
-    if imdb_rating is not None:
-        rating_score = max(0.0, min(float(imdb_rating) / 10.0, 1.0))
-
-    votes_score = 0.0
-    if imdb_votes is not None and imdb_votes > 0:
-        votes_score = min(1.0, math.log10(imdb_votes) / math.log10(max_votes))
-
-    return (rating_weight * rating_score) + (votes_weight * votes_score)
+        return scoring.category_score
+
+    # A missing rating scores like a 0.0 rating, so no separate None branch.
+    rating_score = max(0.0, min((imdb_rating or 0.0) / 10.0, 1.0))
+    votes_score = (
+        min(1.0, math.log10(imdb_votes) / scoring.log10_max_votes)
+        if imdb_votes is not None and imdb_votes > 0
+        else 0.0
+    )
+    return (scoring.rating_weight * rating_score) + (scoring.votes_weight * votes_score)
 
 
 def _compute_popularity(features: Features, config: dict) -> float:
@@ -385,28 +575,31 @@ def _compute_popularity(features: Features, config: dict) -> float:
         features.imdb_votes,
         features.imdb_rating,
         features.starmeter,
-        config,
+        _ScoringConfig.from_config(config),
     )
 
 
-def _best_alternative_popularity(features: Features, config: dict) -> Tuple[float, Optional[dict]]:
+def _best_alternative_popularity(features: Features, scoring: _ScoringConfig) -> Tuple[float, Optional[dict]]:
     best = 0.0
     best_alt = None
-    candidates = list(features.alternatives)
-    if features.best_alternative and features.best_alternative not in candidates:
-        candidates.append(features.best_alternative)
+    candidates = features.alternatives
+    if features.best_alternative:
+        # A best_alternative equal to a listed one scores the same and cannot
+        # beat it under the strict ">" below, so no membership test is needed.
+        candidates = chain(candidates, (features.best_alternative,))
     for alt in candidates:
         pop = _compute_popularity_entry(
             alt.content_type,
             alt.imdb_votes,
             alt.imdb_rating,
             alt.starmeter,
-            config,
+            scoring,
         )
         if pop > best:
             best = pop
-            best_alt = alt.model_dump()
-    return best, best_alt
+            best_alt = alt
+    # Only the winner is serialized for the debug output.
+    return best, best_alt.model_dump() if best_alt is not None else None
 
 
 def _compute_dominance_ratio(popularity: float, alt_best: float) -> float:
@@ -426,23 +619,12 @@ def _detect_sequel_penalty(result: str, query: str, official_title: Optional[str
     """
     if not result:
         return False
-    sequel_markers = [
-        r"\b2\b",
-        r"\b3\b",
-        r"\b4\b",
-        r"\bii\b",
-        r"\biii\b",
-        r"\biv\b",
-        r"\bpart\s+2\b",
-        r"\bpart\s+3\b",
-        r"\bpart\s+4\b",
-    ]
-    if not any(re.search(marker, result, re.IGNORECASE) for marker in sequel_markers):
+    if not _SEQUEL_RE.search(result):
         return False
     if not query:
         return True
     # If query explicitly includes sequel marker, no penalty
-    if any(re.search(marker, query, re.IGNORECASE) for marker in sequel_markers):
+    if _SEQUEL_RE.search(query):
         return False
 
     # CT02: Check if query matches the franchise name (prefix of result/title)
@@ -461,8 +643,8 @@ def _detect_sequel_penalty(result: str, query: str, official_title: Optional[str
             return False  # Query matches franchise, no penalty
 
         # Also check first word of title (franchise name often first)
-        title_words = [_normalize_punct(w) for w in re.findall(r"[A-Za-z0-9']+", official_title)]
-        if title_words and title_words[0].startswith(query_norm):
+        first_word = _WORD_RE.search(official_title)
+        if first_word and _normalize_punct(first_word.group()).startswith(query_norm):
             return False  # Query matches franchise first word
 
     # Penalty applies only if query doesn't relate to franchise
@@ -482,15 +664,9 @@ def _weak_prefix_word_match(query: str, official_title: Optional[str], max_len:
     query = query.strip().casefold()
     if not query or len(query) > max_len:
         return False
-    words = re.findall(r"[A-Za-z0-9']+", official_title)
-    if not words:
-        return False
-    for idx, word in enumerate(words):
-        if idx == 0:
-            continue
-        if word.casefold().startswith(query):
-            return True
-    return False
+    # Only non-first words count as a weak (poorly related) prefix match.
+    words = _WORD_RE.findall(official_title)
+    return any(word.casefold().startswith(query) for word in words[1:])
 
 
 def _is_complex_hint(text: str) -> bool:
@@ -506,27 +682,18 @@ def _is_complex_hint(text: str) -> bool:
         return False
     lower = text.strip().casefold()
 
-    # Multiple modifier indicators
-    complexity_patterns = [
-        r"\b(with|featuring|about|starring)\b.*\b(and|or|that)\b",  # chained conditions
-        r"\bthat\s+are\b.*\band\b",  # "that are X and Y"
-        r"\b(both|also|as well as)\b",  # explicit multi-aspect
-        r"\b(from\s+the|in\s+the)\b.*\b(with|featuring|about)\b",  # era + condition
-        r"(movies?|films?|shows?)\s+that\s+\w+\s+and\s+\w+",  # "movies that X and Y"
-    ]
-
-    for pattern in complexity_patterns:
-        if re.search(pattern, lower):
-            return True
+    if _COMPLEXITY_RE.search(lower):
+        return True
 
     # Word count heuristic: very long hints are usually complex
-    word_count = len(re.findall(r"\w+", lower))
+    word_count = len(_UNICODE_WORD_RE.findall(lower))
     if word_count >= 8:
         return True
 
     return False
 
 
+@lru_cache(maxsize=4096)
 def _detect_category_result(result: str, query: str) -> bool:
     """
     Detect if result is a category/genre description rather than a specific title.
@@ -547,39 +714,26 @@ def _detect_category_result(result: str, query: str) -> bool:
         return False
 
     # Check if result contains category indicators
-    category_indicators = [
-        r"\banimation\b",
-        r"\banimated\b",
-        r"\baction\s+movies?\b",
-        r"\bcomedy\s+movies?\b",
-        r"\bhorror\s+movies?\b",
-        r"\bdrama\s+movies?\b",
-        r"\bdisney\+?\b.*\b(movies?|shows?|series|animation)\b",
-        r"\bnetflix\b.*\b(movies?|shows?|series|originals?)\b",
-        r"\bmovies?\s+(that|with|featuring|about)\b",
-        r"\bfilms?\s+(that|with|featuring|about)\b",
-        r"\bsuperheroes?\b",
-        r"\baction\b.*\bsuperheroes?\b",
-    ]
-
-    for pattern in category_indicators:
-        if re.search(pattern, result_lower):
-            # Verify the result relates to the query
-            if query_lower and query_lower in result_lower:
-                return True
-            # Check if query is a prefix of any word in result
-            words = re.findall(r"[a-z0-9]+", result_lower)
-            for word in words:
-                if word.startswith(query_lower):
-                    return True
+    if not _CATEGORY_RE.search(result_lower):
+        return False
+    # Verify the result relates to the query
+    if query_lower and query_lower in result_lower:
+        return True
+    # Check if query is a prefix of any word in result
+    words = _LOWER_WORD_RE.findall(result_lower)
+    for word in words:
+        if word.startswith(query_lower):
+            return True
     return False
 
 
-def _score_features(features: Features, config: dict, mode: str = "prefix") -> Tuple[float, Dict[str, float]]:
-    weights = config.get("weights", {})
-    match_weight = float(weights.get("match", 0.5))
-    popularity_weight = float(weights.get("popularity", 0.3))
-    dominance_weight = float(weights.get("dominance", 0.2))
+def _score_features(features: Features, scoring: _ScoringConfig, mode: str = "prefix", *,
+                    category_not_title: Optional[bool] = None,
+                    is_category: Optional[bool] = None) -> Tuple[float, Dict[str, float]]:
+    if category_not_title is None:
+        category_not_title = _detect_category_not_title(features.official_title)
+    if is_category is None:
+        is_category = _detect_category_result(features.result, features.query)
 
     match_strength = _compute_match_strength(features.result, features.official_title)
 
@@ -591,10 +745,9 @@ def _score_features(features: Features, config: dict, mode: str = "prefix") -> T
     is_secondary_match = prefix_match_result[1]
 
     content_type = features.content_type
-    if content_type == "unknown" and _detect_category_not_title(features.official_title):
+    if content_type == "unknown" and category_not_title:
         content_type = "category"
     # Handle category results
-    is_category = _detect_category_result(features.result, features.query)
     if is_category and content_type == "unknown":
         content_type = "category"
 
@@ -603,16 +756,20 @@ def _score_features(features: Features, config: dict, mode: str = "prefix") -> T
         features.imdb_votes,
         features.imdb_rating,
         features.starmeter,
-        config,
+        scoring,
     )
-    alt_best_popularity, best_alt = _best_alternative_popularity(features, config)
+    alt_best_popularity, best_alt = _best_alternative_popularity(features, scoring)
     dominance_ratio = _compute_dominance_ratio(popularity, alt_best_popularity)
 
-    score = (match_weight * match_strength) + (popularity_weight * popularity) + (dominance_weight * dominance_ratio)
+    score = (
+        (scoring.match_weight * match_strength)
+        + (scoring.popularity_weight * popularity)
+        + (scoring.dominance_weight * dominance_ratio)
+    )
 
     sequel_penalty = 0.0
     if _detect_sequel_penalty(features.result, features.query, features.official_title):
-        sequel_penalty = float(config.get("sequel_penalty", 0.0))
+        sequel_penalty = scoring.sequel_penalty
         score = max(0.0, score - sequel_penalty)
 
     return score, {
@@ -645,8 +802,75 @@ def _comment_for_rating(mode: str, rating: str, score: float, reason: str) -> st
     return f"{basis}: {detail}; rated {rating}."
 
 
-def score_features(features: Features, config: dict) -> ScoreOutput:
-    mode = detect_mode(features.query)
+def _build_output(features: Features, mode: str, rating: str, comment: str, gates: Dict[str, bool],
+                  feature_dump: dict, score: float, thresholds: dict) -> ScoreOutput:
+    """Assemble a ScoreOutput without re-validating it.
+
+    Every field is built here from already-typed values, so the models are
+    constructed directly; the two dicts validation would have copied out of
+    the config and the features are copied explicitly.
+    """
+    return ScoreOutput.model_construct(
+        task_id=features.task_id,
+        rating=rating,
+        comment=comment,
+        debug=ScoreDebug.model_construct(
+            mode=mode,
+            gates=gates,
+            features=feature_dump,
+            score=score,
+            thresholds=dict(thresholds),
+            evidence_refs=dict(features.evidence_refs),
+        ),
+    )
+
+
+# Gate flags reported in debug output; copied per output so callers may mutate it.
+_GATES_CONCERNS = MappingProxyType({"concerns": True, "validation": False, "spelling": False})
+_GATES_EXTRA_LANGUAGE = MappingProxyType(
+    {"concerns": False, "validation": False, "spelling": False, "extra_language": True}
+)
+_GATES_VALIDATION = MappingProxyType({"concerns": False, "validation": True, "spelling": False})
+_GATES_SPELLING = MappingProxyType({"concerns": False, "validation": False, "spelling": True})
+_GATES_PASSED = MappingProxyType({"concerns": False, "validation": False, "spelling": False})
+
+
+@lru_cache(maxsize=64)
+def _gate_comment(mode: str, rating: str, reason: str) -> str:
+    # Gated outputs always score 0.0, so their comment depends only on these.
+    return _comment_for_rating(mode, rating, 0.0, reason)
+
+
+def _feature_dump(features: Features, *extras: Mapping[str, object]) -> dict:
+    # Extend the fresh model_dump() in place; same key order as {**dump, **extra}.
+    dump = features.model_dump()
+    for extra in extras:
+        dump.update(extra)
+    return dump
+
+
+def _gated_output(features: Features, mode: str, rating: str, reason: str, gates: Mapping[str, bool],
+                  thresholds: dict, feature_dump: Optional[dict] = None) -> ScoreOutput:
+    """Build the zero-score output shared by every gate."""
+    return _build_output(
+        features,
+        mode,
+        rating,
+        _gate_comment(mode, rating, reason),
+        dict(gates),
+        features.model_dump() if feature_dump is None else feature_dump,
+        0.0,
+        thresholds,
+    )
+
+
+def _gate_output(features: Features, config: dict, mode: str) -> Tuple[Optional[ScoreOutput], bool]:
+    """Run the concerns/extra-language/validation/spelling gates.
+
+    Returns the gated output (or None when every gate passes) and the
+    incomplete-title flag. Gate decisions read only concerns_keywords from the
+    config, so they do not change across threshold/weight/dominance trials.
+    """
     thresholds = config.get("thresholds", {})
     concerns_keywords = config.get("concerns_keywords", [])
 
@@ -655,20 +879,10 @@ def score_features(features: Features, config: dict) -> ScoreOutput:
         concerns_keywords,
     )
     if concerns_gate:
-        comment = _comment_for_rating(mode, "Unacceptable: Concerns", 0.0, "concerns keyword match")
-        return ScoreOutput(
-            task_id=features.task_id,
-            rating="Unacceptable: Concerns",
-            comment=comment,
-            debug={
-                "mode": mode,
-                "gates": {"concerns": True, "validation": False, "spelling": False},
-                "features": features.model_dump(),
-                "score": 0.0,
-                "thresholds": thresholds,
-                "evidence_refs": features.evidence_refs,
-            },
-        )
+        return _gated_output(
+            features, mode, "Unacceptable: Concerns", "concerns keyword match",
+            _GATES_CONCERNS, thresholds,
+        ), False
 
     # Detect non-title format BEFORE validation gate
     # This triggers "Unacceptable: Extra Language" for conversational/question results
@@ -676,25 +890,13 @@ def score_features(features: Features, config: dict) -> ScoreOutput:
     is_category_result = _detect_category_result(features.result, features.query)
     non_title_format = _is_non_title_format(features.result) and not is_category_result
     if non_title_format:
-        reason = "non-title format (conversational or question)"
-        comment = _comment_for_rating(mode, "Unacceptable: Extra Language", 0.0, reason)
-        return ScoreOutput(
-            task_id=features.task_id,
-            rating="Unacceptable: Extra Language",
-            comment=comment,
-            debug={
-                "mode": mode,
-                "gates": {"concerns": False, "validation": False, "spelling": False, "extra_language": True},
-                "features": features.model_dump(),
-                "score": 0.0,
-                "thresholds": thresholds,
-                "evidence_refs": features.evidence_refs,
-            },
-        )
+        return _gated_output(
+            features, mode, "Unacceptable: Extra Language", "non-title format (conversational or question)",
+            _GATES_EXTRA_LANGUAGE, thresholds,
+        ), False
 
-    # For category-like results, treat as valid if result is a sensible category phrase
-    # even without a specific IMDb title page
-    is_category_result = _detect_category_result(features.result, features.query)
+    # For category-like results (is_category_result above), treat as valid if
+    # result is a sensible category phrase even without a specific IMDb title page
 
     validation_failure = False
     if not features.result.strip():
@@ -705,50 +907,218 @@ def score_features(features: Features, config: dict) -> ScoreOutput:
         if not is_category_result:
             validation_failure = True
     if validation_failure:
-        comment = _comment_for_rating(mode, "Problem: Other", 0.0, "validation failure")
-        return ScoreOutput(
-            task_id=features.task_id,
-            rating="Problem: Other",
-            comment=comment,
-            debug={
-                "mode": mode,
-                "gates": {"concerns": False, "validation": True, "spelling": False},
-                "features": features.model_dump(),
-                "score": 0.0,
-                "thresholds": thresholds,
-                "evidence_refs": features.evidence_refs,
-            },
-        )
+        return _gated_output(
+            features, mode, "Problem: Other", "validation failure",
+            _GATES_VALIDATION, thresholds,
+        ), False
 
     spelling_gate, incomplete_title, conversational, _ = _detect_spelling_gate(
         features.result, features.official_title, is_category=is_category_result
     )
     if spelling_gate:
         reason = "conversational filler" if conversational else "missing punctuation or diacritics"
-        comment = _comment_for_rating(mode, "Unacceptable: Spelling", 0.0, reason)
-        return ScoreOutput(
-            task_id=features.task_id,
-            rating="Unacceptable: Spelling",
-            comment=comment,
-            debug={
-                "mode": mode,
-                "gates": {"concerns": False, "validation": False, "spelling": True},
-                "features": {**features.model_dump(), "incomplete_title": incomplete_title},
-                "score": 0.0,
-                "thresholds": thresholds,
-                "evidence_refs": features.evidence_refs,
-            },
-        )
+        return _gated_output(
+            features, mode, "Unacceptable: Spelling", reason,
+            _GATES_SPELLING, thresholds,
+            _feature_dump(features, {"incomplete_title": incomplete_title}),
+        ), incomplete_title
+
+    return None, incomplete_title
 
-    score, components = _score_features(features, config, mode)
-    rating = _map_label(score, thresholds)
 
-    # Get prefix match strength (0-2 scale) and secondary match flag
+def _prefix_mode_rating(features: Features, config: dict, components: Dict[str, float],
+                        rating: str, incomplete_title: bool, alternative_exists: bool) -> Tuple[str, bool]:
+    """Apply the prefix-mode rating rules; returns (rating, short_prefix_cap)."""
     prefix_match = components.get("prefix_match_strength", 0)
     is_secondary_match = components.get("is_secondary_match", False)
     is_category = components.get("is_category", False)
+    content_type_computed = components.get("content_type_computed", features.content_type)
+    incomplete_cfg = config.get("incomplete_title", {})
+
+    # Perfect: strong match (2) AND high match_strength, without major alternatives
+    # Good: strong match (2) but weaker position, OR related match (1) with high popularity
+    # Acceptable: related match (1), OR niche/incomplete
+
+    # Handle person pages specially
+    if content_type_computed == "person":
+        # Person pages: score based on name match AND prominence
+        # Note: movie alternatives are NOT considered superior to person results
+        # because they're different content types
+        if prefix_match == 2 and components["match_strength"] >= 0.95:
+            # Strong name match - check if this person is among the top candidates
+            # If they're not in query_candidates at all, they're not the most obvious choice
+            result_lower = features.result.strip().casefold()
+            in_top_candidates = False
+            for candidate in features.query_candidates[:5]:
+                candidate_lower = candidate.casefold()
+                if result_lower in candidate_lower or candidate_lower in result_lower:
+                    in_top_candidates = True
+                    break
 
+            if in_top_candidates:
+                rating = "Perfect"  # This person is among the top completions
+            else:
+                rating = "Acceptable"  # Valid but not the most obvious choice
+        elif prefix_match == 2:
+            # Good match but not exact
+            rating = "Good"
+        elif prefix_match == 1:
+            # Related but not strong match
+            rating = "Acceptable"
+        else:
+            rating = "Unacceptable: Other"
+
+    # Handle category results
+    elif is_category:
+        # Category results: check if query is well represented
+        result_lower = features.result.strip().casefold()
+        query_lower = features.query.strip().casefold()
+        # Check if query prefix appears prominently
+        words = _LOWER_WORD_RE.findall(result_lower)
+        prefix_in_result = any(w.startswith(query_lower) for w in words)
+        if prefix_in_result:
+            # Check if this is a specific vs broad category
+            # Specific: "disney+ animation", "netflix originals"
+            # Broad: "action movies that feature superheroes", "movies that..."
+            is_broad = ("movies that" in result_lower or "films that" in result_lower
+                        or "that feature" in result_lower or len(result_lower.split()) > 4)
+
+            if is_broad:
+                rating = "Good"  # Valid but broad/complex category
+            else:
+                # Check if this is a mainstream category
+                mainstream_indicators = ["disney", "netflix", "animation"]
+                is_mainstream = any(ind in result_lower for ind in mainstream_indicators)
+                if is_mainstream:
+                    rating = "Perfect"  # Specific mainstream category
+                else:
+                    rating = "Good"  # Valid but less mainstream category
+        else:
+            rating = "Acceptable"  # Category but weak prefix match
+
+    # Handle regular titles
+    elif prefix_match == 2:
+        # Strong prefix match - check popularity for final rating
+        if components["match_strength"] >= 0.95 and components["popularity"] >= 0.7:
+            # High popularity and perfect match - but still check for better alternatives
+            # Use higher threshold for high-quality content (rating >= 7.0)
+            # High-quality content is more defensible even with popular alternatives
+            quality_rating = features.imdb_rating or 0
+            alt_threshold = 1.25 if quality_rating >= 7.0 else 1.15
+            if components["alt_best_popularity"] > components["popularity"] * alt_threshold:
+                rating = "Good"  # Better alternatives exist
+            else:
+                rating = "Perfect"
+        elif components["match_strength"] >= 0.95 and components["popularity"] >= 0.5:
+            # Good popularity and perfect match
+            if alternative_exists and components["alt_best_popularity"] > components["popularity"] * 1.2:
+                rating = "Good"  # Better alternatives exist
+            else:
+                rating = "Perfect"
+        elif alternative_exists:
+            rating = "Good"  # Strong match but alternatives exist
+        else:
+            rating = "Good"  # Strong match but lower popularity
+
+    elif prefix_match == 1:
+        # REL03: Secondary/middle-string matches → max Acceptable (not relevant)
+        # Example: "dark" matching "The Dark Knight" in middle → Acceptable
+        if is_secondary_match:
+            # Middle-string matches are poorly related, max Acceptable
+            rating = "Acceptable"
+        elif components["popularity"] >= 0.7:
+            # Related match (not secondary) with high popularity
+            rating = "Good"
+        else:
+            rating = "Acceptable"
+
+    else:
+        # Irrelevant match (0)
+        rating = "Unacceptable: Other"
+
+    # Niche downgrade: if popularity is very low, cap at Acceptable
+    # Note: person pages and categories don't have traditional popularity scores
+    if components["popularity"] < 0.2 and rating in ("Perfect", "Good"):
+        if not is_category and content_type_computed != "person":
+            rating = "Acceptable"
+
+    # R04, POP02, POP03: Prefix-length weighting
+    # Short prefixes have many possible intents → cap at Good
+    # Long prefixes have fewer intents → can achieve Perfect more easily
+    query_len = len(features.query.strip()) if features.query else 0
+    short_prefix_threshold = config.get("short_prefix_max_len", 2)
+    short_prefix_cap = query_len <= short_prefix_threshold and rating == "Perfect"
+    if short_prefix_cap:
+        rating = "Good"  # Too many possible intents for short prefix
+
+    # Alternative-based downgrade for non-person, non-category results
+    if not is_category and content_type_computed != "person":
+        if alternative_exists and components["popularity"] < 0.6 and rating == "Good":
+            rating = "Acceptable"
+
+    # Incomplete title handling - ensure at least Acceptable
+    if incomplete_title:
+        if rating == "Unacceptable: Other":
+            rating = "Acceptable"
+        # Can upgrade incomplete title if dominance is very high
+        upgrade = (
+            components["dominance_ratio"] >= incomplete_cfg.get("upgrade_dominance", 0.85)
+            and components["match_strength"] >= incomplete_cfg.get("upgrade_match", 0.9)
+        )
+        if not upgrade and rating in ("Perfect", "Good"):
+            rating = "Acceptable"
+
+    return rating, short_prefix_cap
+
+
+def _intent_mode_rating(config: dict, components: Dict[str, float], rating: str,
+                        incomplete_title: bool, dominance_valid: bool) -> str:
+    """Apply the intent-mode incomplete-title and dominance cutoff rules."""
     incomplete_cfg = config.get("incomplete_title", {})
+    dominance_cutoffs = config.get("dominance_cutoffs", {})
+    dom_perfect = dominance_cutoffs.get("perfect", 0.85)
+    dom_good = dominance_cutoffs.get("good", 0.7)
+    dom_acceptable = dominance_cutoffs.get("acceptable", 0.55)
+
+    if incomplete_title:
+        upgrade = (
+            components["dominance_ratio"] >= incomplete_cfg.get("upgrade_dominance", 0.85)
+            and components["match_strength"] >= incomplete_cfg.get("upgrade_match", 0.9)
+        )
+        if not upgrade:
+            rating = "Acceptable"
+
+    if dominance_valid:
+        if components["dominance_ratio"] < dom_acceptable:
+            rating = "Unacceptable: Other"
+        else:
+            if rating == "Perfect" and components["dominance_ratio"] < dom_perfect:
+                rating = "Good"
+            elif rating in ("Perfect", "Good") and components["dominance_ratio"] < dom_good:
+                rating = "Acceptable"
+    return rating
+
+
+def score_features(features: Features, config: dict) -> ScoreOutput:
+    mode = detect_mode(features.query)
+    gated, incomplete_title = _gate_output(features, config, mode)
+    if gated is not None:
+        return gated
+    return _score_ungated(features, config, mode, incomplete_title, *_prepare_config(config))
+
+
+def _score_ungated(features: Features, config: dict, mode: str, incomplete_title: bool,
+                   scoring: _ScoringConfig, rules: _RuleConfig) -> ScoreOutput:
+    """Score a row that passed every gate, using values prepared from config."""
+    thresholds = config.get("thresholds", {})
+    category_not_title = _detect_category_not_title(features.official_title)
+    # Memoized, so this reuses the gate's result.
+    is_category = _detect_category_result(features.result, features.query)
+    score, components = _score_features(
+        features, scoring, mode, category_not_title=category_not_title, is_category=is_category
+    )
+    rating = _map_label(score, thresholds)
+
     dominance_cfg = config.get("dominance", {})
     min_votes_for_dominance = dominance_cfg.get("min_votes_for_dominance")
     low_vote_neutral = False
@@ -764,182 +1134,27 @@ def score_features(features: Features, config: dict) -> ScoreOutput:
                 components["dominance_ratio"] = 0.5
 
     if not dominance_valid:
-        weights = config.get("weights", {})
-        match_weight = float(weights.get("match", 0.5))
-        popularity_weight = float(weights.get("popularity", 0.3))
-        score = (match_weight * components["match_strength"]) + (popularity_weight * components["popularity"])
+        score = (
+            (scoring.match_weight * components["match_strength"])
+            + (scoring.popularity_weight * components["popularity"])
+        )
         if components.get("sequel_penalty"):
             score = max(0.0, score - components["sequel_penalty"])
 
-    alt_margin = float(config.get("alt_margin", 0.2))
-    alternative_min_pop = float(config.get("alt_min_popularity", 0.05))
     alternative_exists = False
     if not low_vote_neutral and components["alt_best_popularity"] > 0.0:
         if components["popularity"] <= 0.0:
-            alternative_exists = components["alt_best_popularity"] >= alternative_min_pop
+            alternative_exists = components["alt_best_popularity"] >= rules.alt_min_popularity
         else:
-            alternative_exists = components["alt_best_popularity"] >= components["popularity"] * (1.0 + alt_margin)
-
-    dominance_cutoffs = config.get("dominance_cutoffs", {})
-    dom_perfect = dominance_cutoffs.get("perfect", 0.85)
-    dom_good = dominance_cutoffs.get("good", 0.7)
-    dom_acceptable = dominance_cutoffs.get("acceptable", 0.55)
-
-    # For prefix mode, use prefix_match_strength as primary signal
-    content_type_computed = components.get("content_type_computed", features.content_type)
-    short_prefix_cap = False  # Will be set in prefix mode if query is too short
+            alternative_exists = components["alt_best_popularity"] >= components["popularity"] * (1.0 + rules.alt_margin)
 
     if mode == "prefix":
-        # Perfect: strong match (2) AND high match_strength, without major alternatives
-        # Good: strong match (2) but weaker position, OR related match (1) with high popularity
-        # Acceptable: related match (1), OR niche/incomplete
-
-        # Handle person pages specially
-        if content_type_computed == "person":
-            # Person pages: score based on name match AND prominence
-            # Note: movie alternatives are NOT considered superior to person results
-            # because they're different content types
-            if prefix_match == 2 and components["match_strength"] >= 0.95:
-                # Strong name match - check if this person is among the top candidates
-                # If they're not in query_candidates at all, they're not the most obvious choice
-                result_lower = features.result.strip().casefold()
-                in_top_candidates = False
-                for candidate in features.query_candidates[:5]:
-                    if result_lower in candidate.casefold() or candidate.casefold() in result_lower:
-                        in_top_candidates = True
-                        break
-
-                if in_top_candidates:
-                    rating = "Perfect"  # This person is among the top completions
-                else:
-                    rating = "Acceptable"  # Valid but not the most obvious choice
-            elif prefix_match == 2:
-                # Good match but not exact
-                rating = "Good"
-            elif prefix_match == 1:
-                # Related but not strong match
-                rating = "Acceptable"
-            else:
-                rating = "Unacceptable: Other"
-
-        # Handle category results
-        elif is_category:
-            # Category results: check if query is well represented
-            result_lower = features.result.strip().casefold()
-            query_lower = features.query.strip().casefold()
-            # Check if query prefix appears prominently
-            words = re.findall(r"[a-z0-9]+", result_lower)
-            prefix_in_result = any(w.startswith(query_lower) for w in words)
-            if prefix_in_result:
-                # Check if this is a specific vs broad category
-                # Specific: "disney+ animation", "netflix originals"
-                # Broad: "action movies that feature superheroes", "movies that..."
-                is_broad = ("movies that" in result_lower or "films that" in result_lower
-                            or "that feature" in result_lower or len(result_lower.split()) > 4)
-
-                if is_broad:
-                    rating = "Good"  # Valid but broad/complex category
-                else:
-                    # Check if this is a mainstream category
-                    mainstream_indicators = ["disney", "netflix", "animation"]
-                    is_mainstream = any(ind in result_lower for ind in mainstream_indicators)
-                    if is_mainstream:
-                        rating = "Perfect"  # Specific mainstream category
-                    else:
-                        rating = "Good"  # Valid but less mainstream category
-            else:
-                rating = "Acceptable"  # Category but weak prefix match
-
-        # Handle regular titles
-        elif prefix_match == 2:
-            # Strong prefix match - check popularity for final rating
-            if components["match_strength"] >= 0.95 and components["popularity"] >= 0.7:
-                # High popularity and perfect match - but still check for better alternatives
-                # Use higher threshold for high-quality content (rating >= 7.0)
-                # High-quality content is more defensible even with popular alternatives
-                quality_rating = features.imdb_rating or 0
-                alt_threshold = 1.25 if quality_rating >= 7.0 else 1.15
-                if components["alt_best_popularity"] > components["popularity"] * alt_threshold:
-                    rating = "Good"  # Better alternatives exist
-                else:
-                    rating = "Perfect"
-            elif components["match_strength"] >= 0.95 and components["popularity"] >= 0.5:
-                # Good popularity and perfect match
-                if alternative_exists and components["alt_best_popularity"] > components["popularity"] * 1.2:
-                    rating = "Good"  # Better alternatives exist
-                else:
-                    rating = "Perfect"
-            elif alternative_exists:
-                rating = "Good"  # Strong match but alternatives exist
-            else:
-                rating = "Good"  # Strong match but lower popularity
-
-        elif prefix_match == 1:
-            # REL03: Secondary/middle-string matches → max Acceptable (not relevant)
-            # Example: "dark" matching "The Dark Knight" in middle → Acceptable
-            if is_secondary_match:
-                # Middle-string matches are poorly related, max Acceptable
-                rating = "Acceptable"
-            elif components["popularity"] >= 0.7:
-                # Related match (not secondary) with high popularity
-                rating = "Good"
-            else:
-                rating = "Acceptable"
-
-        else:
-            # Irrelevant match (0)
-            rating = "Unacceptable: Other"
-
-        # Niche downgrade: if popularity is very low, cap at Acceptable
-        # Note: person pages and categories don't have traditional popularity scores
-        if components["popularity"] < 0.2 and rating in ("Perfect", "Good"):
-            if not is_category and content_type_computed != "person":
-                rating = "Acceptable"
-
-        # R04, POP02, POP03: Prefix-length weighting
-        # Short prefixes have many possible intents → cap at Good
-        # Long prefixes have fewer intents → can achieve Perfect more easily
-        query_len = len(features.query.strip()) if features.query else 0
-        short_prefix_threshold = config.get("short_prefix_max_len", 2)
-        short_prefix_cap = query_len <= short_prefix_threshold and rating == "Perfect"
-        if short_prefix_cap:
-            rating = "Good"  # Too many possible intents for short prefix
-
-        # Alternative-based downgrade for non-person, non-category results
-        if not is_category and content_type_computed != "person":
-            if alternative_exists and components["popularity"] < 0.6 and rating == "Good":
-                rating = "Acceptable"
-
-        # Incomplete title handling - ensure at least Acceptable
-        if incomplete_title:
-            if rating == "Unacceptable: Other":
-                rating = "Acceptable"
-            # Can upgrade incomplete title if dominance is very high
-            upgrade = (
-                components["dominance_ratio"] >= incomplete_cfg.get("upgrade_dominance", 0.85)
-                and components["match_strength"] >= incomplete_cfg.get("upgrade_match", 0.9)
-            )
-            if not upgrade and rating in ("Perfect", "Good"):
-                rating = "Acceptable"
-
+        rating, short_prefix_cap = _prefix_mode_rating(
+            features, config, components, rating, incomplete_title, alternative_exists
+        )
     else:
-        # Intent mode - original logic
-        if incomplete_title:
-            upgrade = (
-                components["dominance_ratio"] >= incomplete_cfg.get("upgrade_dominance", 0.85)
-                and components["match_strength"] >= incomplete_cfg.get("upgrade_match", 0.9)
-            )
-            if not upgrade:
-                rating = "Acceptable"
-
-        if dominance_valid:
-            if components["dominance_ratio"] < dom_acceptable:
-                rating = "Unacceptable: Other"
-            else:
-                if rating == "Perfect" and components["dominance_ratio"] < dom_perfect:
-                    rating = "Good"
-                elif rating in ("Perfect", "Good") and components["dominance_ratio"] < dom_good:
-                    rating = "Acceptable"
+        short_prefix_cap = False
+        rating = _intent_mode_rating(config, components, rating, incomplete_title, dominance_valid)
 
     # JP01-JP06: Japan-specific writing system rules
     jp_writing_mismatch, jp_mismatch_type = _detect_jp_writing_mismatch(
@@ -957,32 +1172,24 @@ def score_features(features: Features, config: dict) -> ScoreOutput:
     if jp_number_mismatch and rating == "Perfect":
         rating = "Good"
 
-    niche_popularity = float(config.get("niche_popularity", 0.2))
-    irrelevant_match = float(config.get("irrelevant_match_max", 0.6))
-    category_not_title = _detect_category_not_title(features.official_title)
-    niche = components["popularity"] < niche_popularity
-    irrelevant = components["match_strength"] < irrelevant_match
-    weak_prefix_cfg = config.get("weak_prefix", {})
-    weak_prefix_max_len = int(weak_prefix_cfg.get("max_len", 2))
-    weak_prefix_match_min = float(weak_prefix_cfg.get("match_min", 0.8))
-    weak_prefix_pop_min = float(weak_prefix_cfg.get("popularity_min", 0.2))
-    unpopular_cfg = config.get("unpopular_acceptance", {})
-    unpopular_match_min = float(unpopular_cfg.get("match_min", 0.9))
-    unpopular_votes_max = unpopular_cfg.get("votes_max", 5000)
+    niche = components["popularity"] < rules.niche_popularity
+    irrelevant = components["match_strength"] < rules.irrelevant_match
     weak_prefix_match = _weak_prefix_word_match(
         features.query,
         features.official_title,
-        weak_prefix_max_len,
+        rules.weak_prefix_max_len,
     )
     weak_prefix_upgrade = False
     if mode == "prefix" and rating == "Unacceptable: Other" and weak_prefix_match:
-        if components["popularity"] >= weak_prefix_pop_min and components["match_strength"] >= weak_prefix_match_min:
+        if (components["popularity"] >= rules.weak_prefix_popularity_min
+                and components["match_strength"] >= rules.weak_prefix_match_min):
             rating = "Acceptable"
             weak_prefix_upgrade = True
     unpopular_upgrade = False
     if mode == "prefix" and rating == "Unacceptable: Other":
-        if features.imdb_votes is not None and unpopular_votes_max is not None:
-            if components["match_strength"] >= unpopular_match_min and features.imdb_votes < int(unpopular_votes_max):
+        if features.imdb_votes is not None and rules.unpopular_votes_max is not None:
+            if (components["match_strength"] >= rules.unpopular_match_min
+                    and features.imdb_votes < rules.unpopular_votes_max):
                 rating = "Acceptable"
                 unpopular_upgrade = True
 
@@ -1016,37 +1223,91 @@ def score_features(features: Features, config: dict) -> ScoreOutput:
                     break
 
     comment = _comment_for_rating(mode, rating, score, downgrade_reason or "scored")
-    return ScoreOutput(
-        task_id=features.task_id,
-        rating=rating,
-        comment=comment,
-        debug={
-            "mode": mode,
-            "gates": {
-                "concerns": False,
-                "validation": False,
-                "spelling": False,
-                "incomplete_title": incomplete_title,
-            },
-            "features": {
-                **features.model_dump(),
-                **components,
-                "alternative_exists": alternative_exists,
-                "dominance_valid": dominance_valid,
-                "category_not_title": category_not_title,
-                "niche": niche,
-                "irrelevant": irrelevant,
-                "weak_prefix_word_match": weak_prefix_match,
-                "weak_prefix_upgrade": weak_prefix_upgrade,
-                "unpopular_upgrade": unpopular_upgrade,
-                "is_complex_hint": is_complex,
-                "short_prefix_cap": short_prefix_cap,
-                "jp_writing_mismatch": jp_writing_mismatch,
-                "jp_mismatch_type": jp_mismatch_type,
-                "jp_number_mismatch": jp_number_mismatch,
-            },
-            "score": score,
-            "thresholds": thresholds,
-            "evidence_refs": features.evidence_refs,
-        },
+    return _build_output(
+        features,
+        mode,
+        rating,
+        comment,
+        {**_GATES_PASSED, "incomplete_title": incomplete_title},
+        _feature_dump(features, components, {
+            "alternative_exists": alternative_exists,
+            "dominance_valid": dominance_valid,
+            "category_not_title": category_not_title,
+            "niche": niche,
+            "irrelevant": irrelevant,
+            "weak_prefix_word_match": weak_prefix_match,
+            "weak_prefix_upgrade": weak_prefix_upgrade,
+            "unpopular_upgrade": unpopular_upgrade,
+            "is_complex_hint": is_complex,
+            "short_prefix_cap": short_prefix_cap,
+            "jp_writing_mismatch": jp_writing_mismatch,
+            "jp_mismatch_type": jp_mismatch_type,
+            "jp_number_mismatch": jp_number_mismatch,
+        }),
+        score,
+        thresholds,
     )
+
+
+def _alternative_key(alternative) -> Optional[tuple]:
+    if alternative is None:
+        return None
+    return (
+        alternative.name, alternative.imdb_url, alternative.content_type, alternative.imdb_votes,
+        alternative.imdb_rating, alternative.starmeter, alternative.release_year, alternative.end_year,
+        alternative.source,
+    )
+
+
+def _features_key(features: Features) -> tuple:
+    # Every field but task_id: the scorer reads most of them and the debug
+    # dump echoes the rest, so rows equal on this key score identically.
+    return (
+        features.query, features.result, features.official_title, features.content_type,
+        features.imdb_votes, features.imdb_rating, features.starmeter, features.release_year,
+        features.end_year, tuple(features.query_candidates),
+        tuple(_alternative_key(alternative) for alternative in features.alternatives),
+        _alternative_key(features.best_alternative), features.result_imdb_ok,
+        features.result_google_ok, features.result_imdb_blocked, features.result_google_blocked,
+        tuple(features.evidence_refs.items()), tuple(features.errors),
+    )
+
+
+def memoized_scorer(config: dict, maxsize: int = 4096) -> Callable[[Features], ScoreOutput]:
+    """Return a score_features(features, config) wrapper that reuses results
+    for rows whose features differ only by task_id.
+
+    The config is bound, and its weights and cutoffs parsed, once, so it must
+    not be mutated while the scorer is in use. Each call returns its own copy
+    of the output.
+    """
+    cache: Dict[tuple, ScoreOutput] = {}
+    scoring, rules = _prepare_config(config)
+
+    def score(features: Features) -> ScoreOutput:
+        key = _features_key(features)
+        cached = cache.get(key)
+        if cached is None:
+            mode = detect_mode(features.query)
+            output, incomplete_title = _gate_output(features, config, mode)
+            if output is None:
+                output = _score_ungated(features, config, mode, incomplete_title, scoring, rules)
+            if len(cache) < maxsize:
+                cache[key] = output.model_copy(deep=True)
+            return output
+        output = cached.model_copy(deep=True)
+        if output.task_id != features.task_id:
+            output.task_id = features.task_id
+            output.debug.features["task_id"] = features.task_id
+        return output
+
+    return score
+
+
+def score_features_batch(features_list: Sequence[Features], config: dict) -> List[ScoreOutput]:
+    """Score a batch of features with one shared config.
+
+    Rows that differ only by task_id share a single scoring pass.
+    """
+    score = memoized_scorer(config, maxsize=max(len(features_list), 1))
+    return [score(features) for features in features_list]
@@ -1,10 +1,37 @@
+import copy
 import json
 import os
 from datetime import datetime, timezone
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Iterable, Iterator, List
 
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when it is missing
+    orjson = None
+
+
+def _json_loads(text: str):
+    if orjson is None:
+        return json.loads(text)
+    # orjson rejects the NaN/Infinity tokens that json.dumps writes by
+    # default; retry those lines with the stdlib parser. Integers wider than
+    # 64 bits still come back from orjson as floats.
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+try:
+    import lxml  # noqa: F401  (only probed; BeautifulSoup loads it by name)
+except ImportError:  # optional; bs4 falls back to the pure-Python parser
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -14,20 +41,22 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def read_jsonl(path: str) -> List[dict]:
-    rows = []
+def read_jsonl_iter(path: str) -> Iterator[dict]:
     with open(path, "r", encoding="utf-8") as handle:
         for line_num, raw_line in enumerate(handle, start=1):
             if not raw_line.strip():
                 continue
             try:
-                rows.append(json.loads(raw_line))
+                yield _json_loads(raw_line)
             except json.JSONDecodeError as exc:
                 snippet = raw_line.strip()
                 if len(snippet) > 120:
                     snippet = snippet[:117] + "..."
                 raise ValueError(f"Invalid JSON in {path}:{line_num}: {snippet}") from exc
-    return rows
+
+
+def read_jsonl(path: str) -> List[dict]:
+    return list(read_jsonl_iter(path))
 
 
 def write_jsonl(path: str, rows: Iterable[dict]) -> None:
@@ -41,6 +70,17 @@ def load_yaml(path: str) -> dict:
         return yaml.safe_load(handle)
 
 
+@lru_cache(maxsize=8)
+def _load_yaml_at(path: str, mtime_ns: int) -> dict:
+    return load_yaml(path)
+
+
+# Reuses the parse while the file's mtime is unchanged; callers get a deep
+# copy they may mutate.
+def load_yaml_cached(path: str) -> dict:
+    return copy.deepcopy(_load_yaml_at(path, os.stat(path).st_mtime_ns))
+
+
 def dump_yaml(path: str, data: dict) -> None:
     with open(path, "w", encoding="utf-8") as handle:
         yaml.safe_dump(data, handle, sort_keys=False)